@@ -17,5 +17,10 @@ class VSensorAPI(Protocol):
         ...
 
     def read_all(self, registers: Iterable[str] | None = None) -> Dict[str, Optional[int | float]]:
-        """Read multiple registers at once."""
+        """Read multiple registers at once.
+
+        Implementations should fetch the registers in as few transactions as
+        possible (e.g. one Modbus request per contiguous address range) rather
+        than reading them one by one.
+        """
         ...
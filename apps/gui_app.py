@@ -1,13 +1,16 @@
+import functools
 import json
 import math
 import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable
 from tkinter import messagebox, simpledialog
 
 from platformdirs import user_config_path
 
-from registers import BY_NAME
+from registers import BY_NAME, FLOAT32, RegSpec
 from service import VSensorService, Quality
 
 
@@ -15,6 +18,8 @@ CONFIG_FILE_OLD = Path(__file__).with_name("gui_app_config.json")
 CONFIG_FILE = user_config_path("vsensor") / "gui.json"
 DEFAULT_REGISTERS: list[str] = []  # explicit start list
 DEFAULT_INTERVAL = 0.5
+SAVE_DELAY_MS = 500
+BACKGROUND_POLL_MS = 50
 DEFAULT_CLIENT_CONFIG: dict[str, object] = {
     "method": "rtu",
     "port": "/dev/ttyUSB0",
@@ -24,6 +29,35 @@ DEFAULT_CLIENT_CONFIG: dict[str, object] = {
     "device_id": 1,
     "timeout": 3.0,
 }
+SORTED_NAMES = tuple(sorted(BY_NAME))
+NAME_TO_INDEX = {name: idx for idx, name in enumerate(SORTED_NAMES)}
+STATUS_COLORS = {Quality.OK: "green", Quality.STALE: "yellow", Quality.ERROR: "red"}
+
+
+def _make_formatter(spec: RegSpec) -> Callable[[Any], str]:
+    """Return the value formatter for a register spec.
+
+    The spec's ``format`` string is validated once here, so formatting a
+    value later needs no error handling.  Invalid formats fall back to
+    :func:`str`.
+    """
+    fmt = spec.format
+    if not fmt:
+        return str
+    try:
+        fmt.format(0.0)
+    except Exception:
+        return str
+    return fmt.format
+
+
+FORMATTERS = {name: _make_formatter(spec) for name, spec in BY_NAME.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _fmt_hms(sec: int) -> str:
+    """Format a Unix timestamp (whole seconds) as local ``HH:MM:SS``."""
+    return time.strftime("%H:%M:%S", time.localtime(sec))
 
 
 class DashboardApp:
@@ -37,29 +71,43 @@ class DashboardApp:
         self.config = self.load_config()
         self.selected = self.config.get("registers", DEFAULT_REGISTERS)
         self.poll_interval = self.config.get("poll_interval", DEFAULT_INTERVAL)
-        self.update_interval = int(self.poll_interval * 1000)
 
         connection_cfg = self.config.get("connection", {})
         if not isinstance(connection_cfg, dict):
             connection_cfg = {}
         self.client_config: dict[str, object] = dict(DEFAULT_CLIENT_CONFIG)
         self.client_config.update(connection_cfg)
+        # Snapshot of what is on disk; save_config() skips identical writes.
+        self._saved_config = self.config
+        self._save_after_id: str | None = None
 
         self.service = VSensorService(
             registers=self.selected, interval=self.poll_interval, **self.client_config
         )
+        # Single worker: service reconfigurations run one at a time, in order.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Latest connection change; its new service may not be swapped in yet.
+        self._reconnect_future: Future | None = None
 
-        self.banner_var = tk.StringVar(value="")
+        self.banner_var = tk.StringVar(value="Connection error")
         self.banner = tk.Label(self.root, textvariable=self.banner_var, bg="red", fg="white")
+        self._banner_visible = False
+        self._connection_ok = True
+        self._watch_service(self.service)
 
         self.cards_frame = tk.Frame(self.root)
         self.cards_frame.pack(fill="both", expand=True)
 
-        self.cards: dict[str, dict[str, tk.Variable]] = {}
+        self.cards: dict[str, dict[str, Any]] = {}
+        self._card_pool: dict[str, dict[str, Any]] = {}
+        self._grid_size = (0, 0)
+        self._shown_revision: int | None = None
+        self._stale_deadline = math.inf
 
         self.create_menu()
         self.create_cards()
-        self.after_id: int | None = None
+        self.after_id: str | None = None
+        self._next_deadline = time.monotonic()
         self.schedule_update()
 
     # ------------------------------------------------------------------
@@ -94,73 +142,187 @@ class DashboardApp:
         return {}
 
     def save_config(self) -> None:
+        """Schedule writing the configuration to :data:`CONFIG_FILE`.
+
+        Changes made in quick succession are coalesced into a single write
+        :data:`SAVE_DELAY_MS` milliseconds after the last one.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SAVE_DELAY_MS, self._flush_config)
+
+    def _flush_config(self) -> None:
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         data = {
-            "registers": self.selected,
+            "registers": list(self.selected),
             "poll_interval": self.poll_interval,
-            "connection": self.client_config,
+            "connection": dict(self.client_config),
         }
+        if data == self._saved_config:
+            return
         try:
             CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
             with open(CONFIG_FILE, "w", encoding="utf-8") as fh:
                 json.dump(data, fh, indent=2)
         except Exception:
-            pass
+            return
+        self._saved_config = data
 
     # ------------------------------------------------------------------
     def create_cards(self) -> None:
-        for widget in self.cards_frame.winfo_children():
-            widget.destroy()
-        self.cards.clear()
-
-        count = len(self.selected)
-        columns = max(1, math.ceil(math.sqrt(count)))
-        rows = math.ceil(count / columns)
-        for c in range(columns):
-            self.cards_frame.grid_columnconfigure(c, weight=1)
-        for r in range(rows):
-            self.cards_frame.grid_rowconfigure(r, weight=1)
-
-        for idx, name in enumerate(self.selected):
-            spec = BY_NAME.get(name)
-            if not spec:
-                continue
+        """Lay out one card per selected register.
+
+        Card widgets are pooled by register name.  Deselected cards are only
+        hidden with ``grid_remove()`` and shown again when reselected, so a
+        card is built only the first time its register is selected.
+        """
+        # Take the frame out of the layout while rearranging it so Tk computes
+        # the geometry once at the end instead of after every change.
+        self.cards_frame.pack_forget()
+        selected = [name for name in self.selected if name in BY_NAME]
+        for name, card in self._card_pool.items():
+            if name not in selected:
+                card["frame"].grid_remove()
+        self.cards = {}
+        self._shown_revision = None
+        self._stale_deadline = math.inf
+
+        count = len(selected)
+        columns = math.isqrt(count - 1) + 1 if count else 1
+        rows = -(-count // columns)
+        old_columns, old_rows = self._grid_size
+        for c in range(max(columns, old_columns)):
+            self.cards_frame.grid_columnconfigure(c, weight=1 if c < columns else 0)
+        for r in range(max(rows, old_rows)):
+            self.cards_frame.grid_rowconfigure(r, weight=1 if r < rows else 0)
+        self._grid_size = (columns, rows)
+
+        for idx, name in enumerate(selected):
+            card = self._card_pool.get(name)
+            if card is None:
+                card = self._card_pool[name] = self._build_card(name)
             row, col = divmod(idx, columns)
-            frame = tk.Frame(self.cards_frame, relief=tk.RIDGE, borderwidth=2, padx=4, pady=4)
-            frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            frame.bind("<Button-1>", lambda _e, n=name: self.edit_value(n))
-
-            tk.Label(frame, text=name, font=("Arial", 10, "bold")).pack()
-            value_var = tk.StringVar(value="--")
-            tk.Label(frame, textvariable=value_var, font=("Arial", 14)).pack()
-            unit = spec.get("unit", "")
-            tk.Label(frame, text=unit).pack()
-            ts_var = tk.StringVar(value="")
-            tk.Label(frame, textvariable=ts_var, font=("Arial", 8)).pack()
-            status_var = tk.StringVar(value="")
-            status_lbl = tk.Label(frame, textvariable=status_var)
-            status_lbl.pack(fill="x")
-
-            self.cards[name] = {
-                "value": value_var,
-                "timestamp": ts_var,
-                "status": status_var,
-                "status_label": status_lbl,
-            }
+            card["frame"].grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
+            self.cards[name] = card
+
+        if self._banner_visible:
+            self.cards_frame.pack(fill="both", expand=True, before=self.banner)
+        else:
+            self.cards_frame.pack(fill="both", expand=True)
+
+    def _build_card(self, name: str) -> dict[str, Any]:
+        spec = BY_NAME[name]
+        frame = tk.Frame(self.cards_frame, relief=tk.RIDGE, borderwidth=2, padx=4, pady=4)
+        frame.bind("<Button-1>", lambda _e, n=name: self.edit_value(n))
+
+        tk.Label(frame, text=name, font=("Arial", 10, "bold")).pack()
+        value_lbl = tk.Label(frame, text="--", font=("Arial", 14))
+        value_lbl.pack()
+        tk.Label(frame, text=spec.unit).pack()
+        ts_lbl = tk.Label(frame, text="", font=("Arial", 8))
+        ts_lbl.pack()
+        status_lbl = tk.Label(frame, text="")
+        status_lbl.pack(fill="x")
+
+        return {
+            "frame": frame,
+            "spec": spec,
+            "value_label": value_lbl,
+            "timestamp_label": ts_lbl,
+            "status_label": status_lbl,
+            "format_fn": FORMATTERS[name],
+            "last": ("--", None, None),
+        }
+
+    # ------------------------------------------------------------------
+    def _watch_service(self, service: VSensorService) -> None:
+        """Track the connection state of ``service`` for the banner."""
+
+        def on_change(ok: bool) -> None:
+            # Runs on the polling thread: only record the state here and let
+            # update_cards() apply it on the Tk thread.
+            if service is self.service:
+                self._connection_ok = ok
+
+        service.on_connection_change(on_change)
+        self._connection_ok = service.last_poll_ok()
+
+    # ------------------------------------------------------------------
+    def _run_in_background(
+        self,
+        work: Callable[[], Any],
+        on_done: Callable[[Any], None] | None = None,
+    ) -> Future:
+        """Run ``work`` on the worker thread, then ``on_done(result)`` on Tk's.
+
+        Stopping and starting the service can block for seconds on a slow
+        Modbus link, so it must not run on the Tk thread.  Tk itself is not
+        thread-safe; completion is therefore detected by polling the future
+        from the main loop instead of calling into Tk from the worker.
+        """
+        future = self._executor.submit(work)
+
+        def check() -> None:
+            if not future.done():
+                self.root.after(BACKGROUND_POLL_MS, check)
+                return
+            result = future.result()
+            if on_done is not None:
+                on_done(result)
+
+        self.root.after(BACKGROUND_POLL_MS, check)
+        return future
 
     # ------------------------------------------------------------------
     def schedule_update(self) -> None:
+        """Arm the next card refresh on a fixed cadence.
+
+        Deadlines are tracked on the monotonic clock so the time spent in
+        :meth:`update_cards` does not accumulate as drift.  When the GUI falls
+        behind by more than one interval the cadence restarts from now instead
+        of firing a burst of catch-up refreshes.
+        """
         if self.after_id is not None:
             self.root.after_cancel(self.after_id)
-        self.after_id = self.root.after(self.update_interval, self.update_cards)
+        now = time.monotonic()
+        self._next_deadline += self.poll_interval
+        if self._next_deadline <= now:
+            self._next_deadline = now + self.poll_interval
+        delay_ms = max(1, int((self._next_deadline - now) * 1000))
+        self.after_id = self.root.after(delay_ms, self.update_cards)
 
     def update_cards(self) -> None:
-        if not self.service.last_poll_ok():
-            self.banner_var.set("Connection error")
-            if not self.banner.winfo_ismapped():
+        """Refresh the banner and cards from the service cache.
+
+        This only changes widget options and never calls
+        ``update()``/``update_idletasks()``.  Tk redraws everything that
+        changed in a single pass once control returns to the main loop.
+        """
+        show_banner = not self._connection_ok
+        if show_banner != self._banner_visible:
+            if show_banner:
                 self.banner.pack(fill="x")
-        elif self.banner.winfo_ismapped():
-            self.banner.pack_forget()
+            else:
+                self.banner.pack_forget()
+            self._banner_visible = show_banner
+
+        # Nothing to redraw unless the service produced new data or a shown
+        # value is old enough to turn stale.  The deadline is kept on the
+        # monotonic clock, like the service's staleness, so wall clock jumps
+        # cannot postpone the STALE redraw.
+        revision = self.service.revision
+        mono_now = time.monotonic()
+        if revision == self._shown_revision and mono_now <= self._stale_deadline:
+            self.schedule_update()
+            return
+
         entries = self.service.get_all_entries()
+        stale_after = self.service.stale_after
+        # Converts a wall clock timestamp of this pass to the monotonic clock.
+        mono_offset = mono_now - time.time()
+        stale_deadline = math.inf
         for name, widgets in self.cards.items():
             entry = entries.get(name)
             if entry is None:
@@ -171,25 +333,24 @@ class DashboardApp:
                 quality = entry["quality"]
                 value = entry["value"]
                 ts = entry["timestamp"]
-            spec = BY_NAME.get(name, {})
-            fmt = spec.get("format")
-            if value is None:
-                value_str = "--"
-            elif fmt:
-                try:
-                    value_str = fmt.format(value)
-                except Exception:
-                    value_str = str(value)
-            else:
-                value_str = str(value)
-            widgets["value"].set(value_str)
-            if ts is not None:
-                widgets["timestamp"].set(time.strftime("%H:%M:%S", time.localtime(ts)))
-            else:
-                widgets["timestamp"].set("")
-            widgets["status"].set(quality.value)
-            color = {Quality.OK: "green", Quality.STALE: "yellow", Quality.ERROR: "red"}[quality]
-            widgets["status_label"].configure(bg=color)
+            value_str = "--" if value is None else widgets["format_fn"](value)
+            # Only reconfigure labels whose content actually changed; every
+            # call crosses into Tcl and schedules a redraw of the label.
+            last_value, last_ts, last_quality = widgets["last"]
+            if value_str != last_value:
+                widgets["value_label"].configure(text=value_str)
+            if ts != last_ts:
+                ts_str = _fmt_hms(int(ts)) if ts is not None else ""
+                widgets["timestamp_label"].configure(text=ts_str)
+            if quality is not last_quality:
+                widgets["status_label"].configure(
+                    text=quality.value, bg=STATUS_COLORS[quality]
+                )
+            widgets["last"] = (value_str, ts, quality)
+            if ts is not None and quality is not Quality.STALE:
+                stale_deadline = min(stale_deadline, ts + mono_offset + stale_after)
+        self._shown_revision = revision
+        self._stale_deadline = stale_deadline
         self.schedule_update()
 
     # ------------------------------------------------------------------
@@ -197,49 +358,72 @@ class DashboardApp:
         top = tk.Toplevel(self.root)
         top.title("Select Registers")
         lb = tk.Listbox(top, selectmode=tk.MULTIPLE)
-        names = sorted(BY_NAME)
-        for idx, name in enumerate(names):
-            lb.insert(tk.END, name)
-            if name in self.selected:
-                lb.selection_set(idx)
+        lb.insert(tk.END, *SORTED_NAMES)
+        # Preselect in contiguous runs: one Tcl call per run, not per row.
+        indices = sorted(NAME_TO_INDEX[n] for n in self.selected if n in NAME_TO_INDEX)
+        runs: list[list[int]] = []
+        for idx in indices:
+            if runs and idx == runs[-1][1] + 1:
+                runs[-1][1] = idx
+            else:
+                runs.append([idx, idx])
+        for first, last in runs:
+            lb.selection_set(first, last)
         lb.pack(fill="both", expand=True)
 
         def apply() -> None:
-            sel = [names[i] for i in lb.curselection()]
+            sel = [SORTED_NAMES[i] for i in lb.curselection()]
             if not sel:
                 messagebox.showwarning("No Selection", "Select at least one register")
                 return
-            self.selected = sel
-            self.service.stop()
-            self.service.configure(registers=self.selected)
-            self.service.start()
-            self.create_cards()
-            self.save_config()
-            top.destroy()
+            if sel == self.selected:
+                top.destroy()
+                return
+            apply_btn.configure(state=tk.DISABLED)
 
-        tk.Button(top, text="Apply", command=apply).pack()
+            def reconfigure() -> None:
+                self.service.stop()
+                self.service.configure(registers=sel)
+                self.service.start()
+
+            def done(_result: object) -> None:
+                self.selected = sel
+                self.create_cards()
+                self.save_config()
+                if top.winfo_exists():
+                    top.destroy()
+
+            self._run_in_background(reconfigure, done)
+
+        apply_btn = tk.Button(top, text="Apply", command=apply)
+        apply_btn.pack()
 
     # ------------------------------------------------------------------
     def change_interval(self) -> None:
         new_val = simpledialog.askfloat(
             "Poll Interval", "Interval in seconds", initialvalue=self.poll_interval, minvalue=0.1
         )
-        if new_val is None:
+        if new_val is None or new_val == self.poll_interval:
             return
         self.poll_interval = new_val
-        self.update_interval = int(self.poll_interval * 1000)
-        self.service.stop()
-        self.service.configure(interval=self.poll_interval)
-        self.service.start()
+        service = self.service
+
+        def reconfigure() -> None:
+            service.stop()
+            service.configure(interval=new_val)
+            service.start()
+
+        self._run_in_background(reconfigure)
         self.save_config()
         self.schedule_update()
 
     # ------------------------------------------------------------------
     def edit_value(self, name: str) -> None:
-        spec = BY_NAME.get(name)
-        if not spec:
+        card = self.cards.get(name)
+        if card is None:
             return
-        if spec.get("rw", "R") == "R":
+        spec = card["spec"]
+        if not spec.writable:
             messagebox.showinfo("Read Only", f"{name} is read-only")
             return
         current = self.service.read_register(name)
@@ -250,7 +434,7 @@ class DashboardApp:
             return
         try:
             value: int | float
-            if spec.get("type") == "float32":
+            if spec.type_code == FLOAT32:
                 value = float(prompt)
             else:
                 value = int(prompt)
@@ -319,10 +503,8 @@ class DashboardApp:
         update_frames()
 
         def apply() -> None:
-            new_config = dict(DEFAULT_CLIENT_CONFIG)
-            for key in DEFAULT_CLIENT_CONFIG:
-                if key in self.client_config:
-                    new_config[key] = self.client_config[key]
+            # client_config already contains every default (merged in __init__).
+            new_config = self.client_config.copy()
 
             method = method_var.get()
             new_config["method"] = method
@@ -383,28 +565,46 @@ class DashboardApp:
                 return
             new_config["timeout"] = timeout
 
+            apply_btn.configure(state=tk.DISABLED)
             old_service = self.service
-            old_service.stop()
-            self.service = VSensorService(
-                registers=self.selected,
-                interval=self.poll_interval,
-                **new_config,
-            )
-            self.service.start()
-            self.client_config = new_config
-            self.save_config()
-            self.schedule_update()
-            top.destroy()
+
+            def reconnect() -> VSensorService:
+                old_service.stop()
+                return VSensorService(
+                    registers=self.selected,
+                    interval=self.poll_interval,
+                    **new_config,
+                )
+
+            def done(service: VSensorService) -> None:
+                self.service = service
+                self._watch_service(service)
+                self._shown_revision = None
+                self.client_config = new_config
+                self.save_config()
+                self.schedule_update()
+                if top.winfo_exists():
+                    top.destroy()
+
+            self._reconnect_future = self._run_in_background(reconnect, done)
 
         btn_frame = tk.Frame(top)
         btn_frame.pack(fill="x", padx=10, pady=(0, 10))
         tk.Button(btn_frame, text="Cancel", command=top.destroy).pack(side=tk.RIGHT)
-        tk.Button(btn_frame, text="Apply", command=apply).pack(side=tk.RIGHT, padx=(0, 5))
+        apply_btn = tk.Button(btn_frame, text="Apply", command=apply)
+        apply_btn.pack(side=tk.RIGHT, padx=(0, 5))
 
     # ------------------------------------------------------------------
     def on_close(self) -> None:
+        # Let a pending reconfiguration finish.  A service created by a
+        # connection change is only swapped in from the main loop, which no
+        # longer runs, so stop it here as well (stop() is idempotent).
+        self._executor.shutdown(wait=True)
+        future = self._reconnect_future
+        if future is not None and future.exception() is None:
+            future.result().stop()
         self.service.stop()
-        self.save_config()
+        self._flush_config()
         self.root.destroy()
 
     # ------------------------------------------------------------------
@@ -1,8 +1,16 @@
-"""HTTP API for interacting with VSensorService without UI."""
+"""HTTP API for interacting with VSensorService without UI.
+
+Endpoints that only read the service cache are ``async`` and run directly on
+the event loop; calls that may block on Modbus I/O are moved to a worker
+thread with :func:`asyncio.to_thread`.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
@@ -14,9 +22,13 @@ PORT = int(os.getenv("PORT", "8000"))
 INTERVAL = float(os.getenv("INTERVAL", "5.0"))
 _stale_after = os.getenv("STALE_AFTER")
 STALE_AFTER = float(_stale_after) if _stale_after is not None else None
+# Rendered /metrics responses are reused for this long; values cannot change
+# faster than the poll interval anyway.
+METRICS_TTL = min(0.5, INTERVAL / 2)
 
 app = FastAPI(title="VSensor Headless Service")
 service = VSensorService(interval=INTERVAL, stale_after=STALE_AFTER)
+_metrics_cache: tuple[float, str] | None = None
 
 
 class RegisterValue(BaseModel):
@@ -24,7 +36,7 @@ class RegisterValue(BaseModel):
 
 
 @app.get("/registers/{name}")
-def read_register(name: str) -> RegisterValue:
+async def read_register(name: str) -> RegisterValue:
     """Return the current value of ``name``."""
     value = service.read_register(name)
     if value is None:
@@ -33,22 +45,22 @@ def read_register(name: str) -> RegisterValue:
 
 
 @app.get("/registers")
-def read_all() -> dict[str, int | float | None]:
+async def read_all() -> dict[str, int | float | None]:
     """Return values for all registers."""
     return service.read_all()
 
 
 @app.post("/registers/{name}")
-def write_register(name: str, payload: RegisterValue) -> RegisterValue:
+async def write_register(name: str, payload: RegisterValue) -> RegisterValue:
     """Write a new value to ``name``."""
-    ok = service.write_register(name, payload.value)
+    ok = await asyncio.to_thread(service.write_register, name, payload.value)
     if not ok:
         raise HTTPException(status_code=500, detail="Write failed")
     return RegisterValue(value=payload.value)
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, int | float | bool | None]:
+async def healthz() -> dict[str, int | float | bool | None]:
     """Return service health and statistics."""
     return {
         "connected": service.last_poll_ok(),
@@ -62,17 +74,24 @@ def healthz() -> dict[str, int | float | bool | None]:
 
 
 @app.get("/metrics")
-def metrics() -> PlainTextResponse:
+async def metrics() -> PlainTextResponse:
     """Return metrics in a simple text format."""
-    data = healthz()
-    lines = [f"{k} {v}" for k, v in data.items()]
-    return PlainTextResponse("\n".join(lines))
+    global _metrics_cache
+    now = time.monotonic()
+    if _metrics_cache is not None and now - _metrics_cache[0] < METRICS_TTL:
+        return PlainTextResponse(_metrics_cache[1])
+    data = await healthz()
+    body = "\n".join(f"{k} {v}" for k, v in data.items())
+    _metrics_cache = (now, body)
+    return PlainTextResponse(body)
 
 
 @app.on_event("shutdown")
-def shutdown() -> None:
+async def shutdown() -> None:
     """Stop background polling when the service shuts down."""
-    service.stop()
+    global _metrics_cache
+    _metrics_cache = None
+    await asyncio.to_thread(service.stop)
 
 
 def main() -> None:
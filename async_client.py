@@ -0,0 +1,260 @@
+"""Asynchronous Modbus client for the CMR Controls V-Sensor.
+
+:class:`AsyncVSensorClient` provides the read and write methods of
+:class:`client.VSensorClient` on top of
+:class:`pymodbus.client.AsyncModbusSerialClient` (or ``AsyncModbusTcpClient``)
+for use inside an :mod:`asyncio` event loop::
+
+    async with AsyncVSensorClient(method="tcp", host="10.0.0.5") as client:
+        print(await client.read_many(["pascals", "setpoint", "mode"]))
+
+Register resolution, request planning and value coding are shared with the
+synchronous client.  The requests of a batched read or write are sent one
+after another; pymodbus serialises requests on a connection anyway.  There
+is no value cache (``cache_ttl``/``invalidate()``) and no connection
+pooling.  As with the synchronous client, errors are logged and
+``None``/``False`` is returned instead of raising an exception.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Iterable, Mapping, Optional
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
+
+from client import (
+    DEFAULT_MAX_GAP,
+    _UNIT_KW,
+    _decode_spec,
+    _encode_spec,
+    _plan_reads,
+    _plan_writes,
+    _resolve,
+)
+from registers import BY_NAME
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncVSensorClient:
+    """Asynchronous high level API for talking to the V-Sensor."""
+
+    def __init__(
+        self,
+        *,
+        method: str = "rtu",
+        port: str = "/dev/ttyUSB0",
+        baudrate: int = 9600,
+        host: str = "localhost",
+        tcp_port: int = 502,
+        device_id: int = 1,
+        timeout: float = 3.0,
+        parity: str = "N",
+        stopbits: int = 1,
+    ) -> None:
+        """Create a new client.
+
+        The parameters are the same as for :class:`client.VSensorClient`.
+        """
+
+        if parity not in {"N", "E", "O"}:
+            raise ValueError(f"invalid parity: {parity}")
+        if stopbits not in {1, 2}:
+            raise ValueError(f"invalid stopbits: {stopbits}")
+
+        self._client: AsyncModbusSerialClient | AsyncModbusTcpClient
+        if method == "rtu":
+            self._client = AsyncModbusSerialClient(
+                port=port,
+                baudrate=baudrate,
+                timeout=timeout,
+                parity=parity,
+                stopbits=stopbits,
+            )
+        elif method == "tcp":
+            self._client = AsyncModbusTcpClient(host=host, port=tcp_port, timeout=timeout)
+        else:  # pragma: no cover - defensive programming
+            raise ValueError(f"unknown method: {method}")
+        self._device_id = device_id
+        self._unit_kwargs = {_UNIT_KW: device_id}
+        self._rejected_spans: set[tuple[int, int]] = set()
+
+    # ------------------------------------------------------------------
+    # Context manager helpers
+    # ------------------------------------------------------------------
+    async def __aenter__(self) -> "AsyncVSensorClient":
+        if not await self.connect():  # pragma: no cover - connection problems
+            raise ConnectionError("Unable to connect to V-Sensor")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - trivial
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+    async def connect(self) -> bool:
+        """Open the connection to the sensor.
+
+        Returns ``True`` on success, ``False`` otherwise.
+        """
+
+        try:
+            return bool(await self._client.connect())
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.error("Failed to connect: %s", exc)
+            return False
+
+    def close(self) -> None:
+        """Close the connection to the sensor."""
+        try:
+            self._client.close()
+        except Exception:  # pragma: no cover - defensive
+            pass
+
+    # ------------------------------------------------------------------
+    # Register helpers
+    # ------------------------------------------------------------------
+    async def _read_block(
+        self, address: int, count: int, label: object
+    ) -> tuple[Optional[list[int]], bool]:
+        """Async counterpart of :meth:`client.VSensorClient._read_block`."""
+
+        error_msg: Optional[str] = None
+        rejected = False
+        for attempt in range(3):
+            try:
+                response = await self._client.read_holding_registers(
+                    address, count=count, **self._unit_kwargs
+                )
+                if response.isError():  # type: ignore[attr-defined]
+                    error_msg = f"Error response while reading {label}: {response}"
+                    rejected = True
+                    break  # the answer would not change on retry
+                elif len(response.registers) < count:
+                    # Decoding would fail on missing words; treat like a rejection.
+                    error_msg = (
+                        f"Short response while reading {label}: "
+                        f"{len(response.registers)} of {count} registers"
+                    )
+                    rejected = True
+                    break  # the answer would not change on retry
+                else:
+                    return response.registers, False
+            except ModbusException as exc:
+                error_msg = f"Modbus error while reading {label}: {exc}"
+                rejected = False
+            except Exception as exc:  # pragma: no cover - defensive
+                error_msg = f"Error while reading {label}: {exc}"
+                rejected = False
+
+            if attempt < 2:
+                await asyncio.sleep(0.2)
+
+        if error_msg:
+            LOGGER.error(error_msg)
+        return None, rejected
+
+    # Public API -------------------------------------------------------
+    async def read_register(self, register: int | str) -> Optional[int | float]:
+        """Read and decode a single register, see :meth:`read_many`."""
+
+        return (await self.read_many([register]))[register]
+
+    async def read_many(
+        self, registers: Iterable[int | str], *, max_gap: int = DEFAULT_MAX_GAP
+    ) -> dict[int | str, Optional[int | float]]:
+        """Read several registers using as few Modbus requests as possible.
+
+        Requests are planned exactly like :meth:`client.VSensorClient.read_many`
+        and awaited one after another.
+        """
+
+        keys = list(registers)
+        items = []
+        for key in keys:
+            address, spec = _resolve(key)
+            items.append((address, spec.length if spec else 1, key, spec))
+
+        values: dict[int | str, Optional[int | float]] = {}
+        for start, count, span in _plan_reads(tuple(items), max_gap):
+            label = span[0][2] if len(span) == 1 else f"registers {start}..{start + count - 1}"
+            if len(span) > 1 and (start, count) in self._rejected_spans:
+                regs, rejected = None, True
+            else:
+                regs, rejected = await self._read_block(start, count, label)
+            if regs is None and rejected and len(span) > 1:
+                self._rejected_spans.add((start, count))
+                for address, length, key, spec in span:
+                    single, _ = await self._read_block(address, length, key)
+                    values[key] = None if single is None else _decode_spec(spec, single)
+                continue
+            for address, length, key, spec in span:
+                values[key] = None if regs is None else _decode_spec(spec, regs, address - start)
+        return {key: values[key] for key in keys}
+
+    async def read_all(
+        self, registers: Optional[Iterable[str]] = None
+    ) -> dict[str, Optional[int | float]]:
+        """Read ``registers`` (default: all known registers) via :meth:`read_many`."""
+
+        names = list(registers) if registers is not None else list(BY_NAME.keys())
+        return await self.read_many(names)  # type: ignore[return-value]
+
+    async def _write_block(self, address: int, registers: list[int], label: object) -> bool:
+        """Async counterpart of :meth:`client.VSensorClient._write_block`."""
+
+        error_msg: Optional[str] = None
+        for attempt in range(3):
+            try:
+                if len(registers) == 1:
+                    response = await self._client.write_register(
+                        address, registers[0], **self._unit_kwargs
+                    )
+                else:
+                    response = await self._client.write_registers(
+                        address, registers, **self._unit_kwargs
+                    )
+                if response.isError():  # type: ignore[attr-defined]
+                    error_msg = f"Error response while writing {label}: {response}"
+                else:
+                    return True
+            except ModbusException as exc:
+                error_msg = f"Modbus error while writing {label}: {exc}"
+            except Exception as exc:  # pragma: no cover - defensive
+                error_msg = f"Error while writing {label}: {exc}"
+
+            if attempt < 2:
+                await asyncio.sleep(0.2)
+
+        if error_msg:
+            LOGGER.error(error_msg)
+        return False
+
+    async def write_register(self, register: int | str, value: int | float) -> bool:
+        """Write a register on the sensor.
+
+        Values are encoded like :meth:`client.VSensorClient.write_register`.
+        Returns ``True`` if the operation succeeded.
+        """
+
+        address, spec = _resolve(register)
+        if spec and not spec.writable:
+            raise ValueError(f"Register {register} is not writable")
+        return await self._write_block(address, _encode_spec(spec, value), register)
+
+    async def write_many(self, updates: Mapping[int | str, int | float]) -> bool:
+        """Write several registers, see :meth:`client.VSensorClient.write_many`.
+
+        Returns ``True`` if every write succeeded.
+        """
+
+        ok = True
+        for start, words, _ in _plan_writes(updates):
+            label = f"registers {start}..{start + len(words) - 1}"
+            if not await self._write_block(start, words, label):
+                ok = False
+        return ok
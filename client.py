@@ -17,24 +17,219 @@ Signed registers are automatically converted to Python ``int`` values.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
+import socket
+import sys
+import threading
 import time
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 from pymodbus.client import ModbusSerialClient, ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-from codec import decode_float32, encode_float32
-from registers import BY_ADDR, BY_NAME, zero_based
+from codec import decode_float32, encode_float32, pack_registers, unpack_float32_from
+from registers import BY_ADDR, BY_NAME, FLOAT32, U16, RegSpec
 
 LOGGER = logging.getLogger(__name__)
 
+#: Maximum number of holding registers allowed in a single read request.
+MAX_READ_COUNT = 125
 
-def _to_signed(value: int) -> int:
-    """Convert a 16-bit unsigned integer to a signed value."""
-    if value & 0x8000:
-        return value - 0x10000
-    return value
+#: Default largest gap of unrequested registers bridged by one read request.
+DEFAULT_MAX_GAP = 4
+
+# ``pymodbus`` changed the keyword for the unit identifier from ``unit`` to
+# ``device_id`` in newer versions.  Determine the proper keyword once at import
+# time for maximum compatibility.
+try:
+    _UNIT_KW = (
+        "unit"
+        if "unit" in inspect.signature(ModbusSerialClient.read_holding_registers).parameters
+        else "device_id"
+    )
+except (TypeError, ValueError):  # pragma: no cover - defensive
+    _UNIT_KW = "device_id"
+
+
+# Decoders indexed by :attr:`registers.RegSpec.type_code`.  They take the
+# words of a whole read request and the offset of the value within it, so
+# batched reads do not copy a slice per register.
+_DECODERS: tuple[Callable[[list[int], int], int | float], ...] = (
+    lambda regs, i: regs[i],  # U16
+    lambda regs, i: (regs[i] ^ 0x8000) - 0x8000,  # S16, two's complement
+    lambda regs, i: decode_float32(regs[i : i + 2]),  # FLOAT32
+)
+
+
+def _encode_word(value: int | float) -> list[int]:
+    """Encode an integer as a single register word.
+
+    Masking with ``0xFFFF`` already yields the two's-complement wire value
+    for negative numbers, so the same encoder serves ``u16`` and ``s16``.
+    """
+    return [int(value) & 0xFFFF]
+
+
+# Encoders indexed by :attr:`registers.RegSpec.type_code`.
+_ENCODERS: tuple[Callable[[int | float], list[int]], ...] = (
+    _encode_word,  # U16
+    _encode_word,  # S16
+    lambda value: encode_float32(float(value)),  # FLOAT32
+)
+
+
+def _decode_spec(spec: RegSpec | None, regs: list[int], offset: int = 0) -> int | float:
+    """Decode the value at ``offset`` in ``regs`` according to ``spec``."""
+
+    if spec is None:
+        return regs[offset]
+    return _DECODERS[spec.type_code](regs, offset)
+
+
+def _encode_spec(spec: RegSpec | None, value: int | float) -> list[int]:
+    """Encode ``value`` into register words according to ``spec``."""
+
+    return _ENCODERS[spec.type_code if spec else U16](value)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve(register: int | str) -> tuple[int, RegSpec | None]:
+    """Resolve a register name or address to ``(0-based address, spec)``.
+
+    The register tables are read-only, so results are cached.
+    """
+
+    if isinstance(register, str):
+        # allow lookup by symbolic name if desired
+        reg_spec = BY_NAME.get(register)
+        if not reg_spec:
+            raise KeyError(f"Unknown register name: {register}")
+        return reg_spec.zb_address, reg_spec
+
+    reg_spec = BY_ADDR.get(register)
+    if reg_spec:
+        return reg_spec.zb_address, reg_spec
+    # Not part of REGISTERS -> assume caller already used 0-based address
+    return int(register), None
+
+
+for _key in (*BY_ADDR, *BY_NAME):
+    _resolve(_key)
+del _key
+
+
+@functools.lru_cache(maxsize=64)
+def _plan_reads(
+    items: tuple[tuple[int, int, Any, Any], ...], max_gap: int
+) -> tuple[tuple[int, int, tuple[tuple[int, int, Any, Any], ...]], ...]:
+    """Group ``(address, count, key, spec)`` items into read requests.
+
+    Items are sorted by address and merged greedily as long as the gap to the
+    previous item is at most ``max_gap`` registers and the request stays within
+    :data:`MAX_READ_COUNT`.  Returns ``(start, count, items)`` tuples.
+
+    Pollers request the same registers every cycle, so plans are cached.
+    """
+
+    spans: list[tuple[int, int, list[tuple[int, int, Any, Any]]]] = []
+    for item in sorted(items, key=lambda item: item[0]):
+        address, count = item[0], item[1]
+        if spans:
+            start, span_count, members = spans[-1]
+            end = start + span_count
+            new_end = max(end, address + count)
+            if address - end <= max_gap and new_end - start <= MAX_READ_COUNT:
+                members.append(item)
+                spans[-1] = (start, new_end - start, members)
+                continue
+        spans.append((address, count, [item]))
+    return tuple((start, count, tuple(members)) for start, count, members in spans)
+
+
+# ``socket`` does not export SO_BUSY_POLL; 46 is its fixed value on Linux, the
+# only platform supporting it.
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+
+
+def _plan_writes(
+    updates: Mapping[int | str, int | float],
+) -> list[tuple[int, list[int], list[int]]]:
+    """Encode ``updates`` and merge directly adjacent registers.
+
+    Returns ``(start address, concatenated words, member addresses)`` per
+    write request.  Raises :class:`ValueError` for read-only registers
+    before anything is sent.
+    """
+
+    items = []
+    for register, value in updates.items():
+        address, spec = _resolve(register)
+        if spec and not spec.writable:
+            raise ValueError(f"Register {register} is not writable")
+        items.append((address, _encode_spec(spec, value)))
+
+    runs: list[tuple[int, list[int], list[int]]] = []
+    for address, words in sorted(items, key=lambda item: item[0]):
+        if runs and runs[-1][0] + len(runs[-1][1]) == address:
+            runs[-1][1].extend(words)
+            runs[-1][2].append(address)
+        else:
+            runs.append((address, list(words), [address]))
+    return runs
+
+
+class _NoDelayTcpClient(ModbusTcpClient):
+    """:class:`ModbusTcpClient` that disables Nagle's algorithm.
+
+    Modbus TCP requests are only a few bytes long, so Nagle's algorithm would
+    otherwise delay them waiting for more data.  ``TCP_NODELAY`` is applied
+    in :meth:`connect`, which pymodbus also calls when it reconnects.  With
+    ``busy_poll`` (microseconds) ``SO_BUSY_POLL`` is set as well.
+    """
+
+    def __init__(self, *args: Any, busy_poll: int = 0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._busy_poll = busy_poll
+
+    def connect(self):  # type: ignore[override]
+        # pymodbus calls connect() before every request; only a newly opened
+        # socket needs its options set.
+        had_socket = self.socket is not None
+        connected = super().connect()
+        sock = self.socket
+        if connected and sock is not None and not had_socket:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError as exc:  # pragma: no cover - platform specific
+                LOGGER.debug("Could not set TCP_NODELAY: %s", exc)
+            if self._busy_poll and sys.platform == "linux":
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, self._busy_poll)
+                except OSError as exc:  # pragma: no cover - needs privileges
+                    LOGGER.warning("Could not set SO_BUSY_POLL: %s", exc)
+        return connected
+
+
+class _SharedTcp:
+    """A pooled TCP connection shared by all clients of one endpoint."""
+
+    __slots__ = ("client", "lock", "users")
+
+    def __init__(self, client: ModbusTcpClient) -> None:
+        self.client = client
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+# Process-wide pool of TCP connections keyed by ``(host, port)``.  Modbus TCP
+# gateways often accept only a handful of connections, so clients talking to
+# the same endpoint share one socket and serialise their requests.  An entry
+# is dropped when its last user closes, so later clients apply their own
+# ``timeout`` and ``busy_poll``.
+_TCP_POOL: dict[tuple[str, int], _SharedTcp] = {}
+_POOL_LOCK = threading.Lock()
 
 
 class VSensorClient:
@@ -52,6 +247,8 @@ class VSensorClient:
         timeout: float = 3.0,
         parity: str = "N",
         stopbits: int = 1,
+        cache_ttl: float = 0.0,
+        busy_poll: int = 0,
     ) -> None:
         """Create a new client.
 
@@ -61,13 +258,16 @@ class VSensorClient:
             Either ``"rtu"`` for serial communication or ``"tcp"`` for a TCP
             connection.  The serial client is backed by
             :class:`ModbusSerialClient` while the TCP variant uses
-            :class:`ModbusTcpClient`.
+            :class:`ModbusTcpClient` with ``TCP_NODELAY`` enabled.
         port:
             Serial port to use when ``method="rtu"``.
         baudrate:
             Baudrate for the serial connection.
         host, tcp_port:
-            Target host and port for TCP connections.
+            Target host and port for TCP connections.  Clients for the same
+            endpoint share one connection (created with the first client's
+            ``timeout``) and serialise their requests on it.  The connection
+            is released when its last client is closed.
         device_id:
             The Modbus unit id of the sensor.
         timeout:
@@ -76,6 +276,15 @@ class VSensorClient:
             Parity for serial connections (``"N"``, ``"E"`` or ``"O"``).
         stopbits:
             Number of stop bits for serial connections (``1`` or ``2``).
+        cache_ttl:
+            Seconds for which successfully read values are reused instead of
+            querying the sensor again.  ``0`` (the default) disables caching.
+            Writes invalidate the written register; see :meth:`invalidate`.
+        busy_poll:
+            Linux only: busy-poll the TCP socket for up to this many
+            microseconds while waiting for a response (``SO_BUSY_POLL``).
+            Trades CPU time for latency; ``0`` (the default) disables it.
+            Like ``timeout`` it is taken from the first client of an endpoint.
         """
 
         if parity not in {"N", "E", "O"}:
@@ -83,7 +292,10 @@ class VSensorClient:
         if stopbits not in {1, 2}:
             raise ValueError(f"invalid stopbits: {stopbits}")
 
+        self._shared: _SharedTcp | None = None
+        self._holds_connection = False
         if method == "rtu":
+            self._io_lock = threading.Lock()
             try:
                 self._client = ModbusSerialClient(
                     method="rtu",
@@ -102,18 +314,30 @@ class VSensorClient:
                     stopbits=stopbits,
                 )
         elif method == "tcp":
-            self._client = ModbusTcpClient(host=host, port=tcp_port, timeout=timeout)
+            self._pool_key = (host, tcp_port)
+            with _POOL_LOCK:
+                shared = _TCP_POOL.get(self._pool_key)
+                if shared is None:
+                    shared = _SharedTcp(
+                        _NoDelayTcpClient(
+                            host=host, port=tcp_port, timeout=timeout, busy_poll=busy_poll
+                        )
+                    )
+                    _TCP_POOL[self._pool_key] = shared
+            self._shared = shared
+            self._client = shared.client
+            self._io_lock = shared.lock
         else:  # pragma: no cover - defensive programming
             raise ValueError(f"unknown method: {method}")
         self._device_id = device_id
-
-        # ``pymodbus`` changed the keyword for the unit identifier from
-        # ``unit`` to ``device_id`` in newer versions.  Determine the proper
-        # keyword at runtime for maximum compatibility.
-        import inspect
-
-        params = inspect.signature(self._client.read_holding_registers).parameters
-        self._unit_kw = "unit" if "unit" in params else "device_id"
+        self._unit_kw = _UNIT_KW
+        self._unit_kwargs = {_UNIT_KW: device_id}
+        self._cache_ttl = cache_ttl
+        # 0-based address -> (monotonic timestamp, spec, decoded value)
+        self._cache: dict[int, tuple[float, RegSpec | None, int | float]] = {}
+        # Merged ``(start, count)`` requests the device rejected; their
+        # registers are read one by one from then on.
+        self._rejected_spans: set[tuple[int, int]] = set()
 
     # ------------------------------------------------------------------
     # Context manager helpers
@@ -136,15 +360,38 @@ class VSensorClient:
         """
 
         try:
-            return bool(self._client.connect())
+            with self._io_lock:
+                connected = bool(self._client.connect())
         except Exception as exc:  # pragma: no cover - defensive
             LOGGER.error("Failed to connect: %s", exc)
             return False
+        if connected and self._shared is not None:
+            with _POOL_LOCK:
+                # Re-register a connection released by an earlier close().
+                _TCP_POOL.setdefault(self._pool_key, self._shared)
+                if not self._holds_connection:
+                    self._shared.users += 1
+                    self._holds_connection = True
+        return connected
 
     def close(self) -> None:
-        """Close the connection to the sensor."""
+        """Close the connection to the sensor.
+
+        A shared TCP connection is only closed once the last client using it
+        has been closed.
+        """
+        if self._shared is not None:
+            with _POOL_LOCK:
+                if self._holds_connection:
+                    self._shared.users -= 1
+                    self._holds_connection = False
+                if self._shared.users > 0:
+                    return
+                if _TCP_POOL.get(self._pool_key) is self._shared:
+                    del _TCP_POOL[self._pool_key]
         try:
-            self._client.close()
+            with self._io_lock:
+                self._client.close()
         except Exception:  # pragma: no cover - defensive
             pass
 
@@ -152,7 +399,7 @@ class VSensorClient:
     # Register helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _spec_for(register: int | str) -> tuple[int, dict[str, Any] | None]:
+    def _spec_for(register: int | str) -> tuple[int, RegSpec | None]:
         """Return address/count and register specification.
 
         ``register`` can be either a 1-based register address as documented in
@@ -160,119 +407,204 @@ class VSensorClient:
         global ``REGISTERS`` dictionary its metadata is returned as well.
         """
 
-        if isinstance(register, str):
-            # allow lookup by symbolic name if desired
-            reg_spec = BY_NAME.get(register)
-            if not reg_spec:
-                raise KeyError(f"Unknown register name: {register}")
-            return zero_based(reg_spec["address"]), reg_spec
+        return _resolve(register)
 
-        reg_spec = BY_ADDR.get(register)
-        if reg_spec:
-            return zero_based(reg_spec["address"]), reg_spec
-        # Not part of REGISTERS -> assume caller already used 0-based address
-        return int(register), None
-
-    # Public API -------------------------------------------------------
-    def read_register(self, register: int | str) -> Optional[int | float]:
-        """Read a single register or register block.
+    def _read_block(
+        self, address: int, count: int, label: object
+    ) -> tuple[Optional[list[int]], bool]:
+        """Read ``count`` raw registers starting at the 0-based ``address``.
 
-        ``register`` may be specified using the 1-based address as defined in
-        :mod:`registers` or as a 0-based address.  When the register metadata
-        is known, values are decoded automatically (signed integers and
-        floating point formats).
+        Requests that get no answer are retried up to three times; rejected
+        ones are not retried.  Returns ``(registers, False)`` on success.
+        Otherwise ``(None, rejected)`` is returned (and the error logged)
+        where ``rejected`` is ``True`` if the device answered with an
+        exception response (or with fewer registers than requested) rather
+        than not answering at all.
         """
 
-        address, spec = self._spec_for(register)
-        count = spec.get("length", 1) if spec else 1
-
         error_msg: Optional[str] = None
+        rejected = False
         for attempt in range(3):
             try:
-                kwargs = {self._unit_kw: self._device_id}
-                response = self._client.read_holding_registers(
-                    address, count=count, **kwargs
-                )
+                with self._io_lock:
+                    response = self._client.read_holding_registers(
+                        address, count=count, **self._unit_kwargs
+                    )
                 if response.isError():  # type: ignore[attr-defined]
-                    error_msg = f"Error response while reading {register}: {response}"
+                    error_msg = f"Error response while reading {label}: {response}"
+                    rejected = True
+                    break  # the answer would not change on retry
+                elif len(response.registers) < count:
+                    # Decoding would fail on missing words; treat like a rejection.
+                    error_msg = (
+                        f"Short response while reading {label}: "
+                        f"{len(response.registers)} of {count} registers"
+                    )
+                    rejected = True
+                    break  # the answer would not change on retry
                 else:
-                    regs = response.registers
-                    if spec is None:
-                        return regs[0]
-
-                    rtype = spec.get("type", "u16")
-                    if rtype == "float32":
-                        return decode_float32(regs)
-                    if rtype == "s16":
-                        return _to_signed(regs[0])
-                    return regs[0]
+                    return response.registers, False
             except ModbusException as exc:
-                error_msg = f"Modbus error while reading {register}: {exc}"
+                error_msg = f"Modbus error while reading {label}: {exc}"
+                rejected = False
             except Exception as exc:  # pragma: no cover - defensive
-                error_msg = f"Error while reading {register}: {exc}"
+                error_msg = f"Error while reading {label}: {exc}"
+                rejected = False
 
             if attempt < 2:
                 time.sleep(0.2)
 
         if error_msg:
             LOGGER.error(error_msg)
-        return None
+        return None, rejected
+
+    # Public API -------------------------------------------------------
+    def read_register(self, register: int | str) -> Optional[int | float]:
+        """Read a single register or register block.
+
+        ``register`` may be specified using the 1-based address as defined in
+        :mod:`registers` or as a 0-based address.  When the register metadata
+        is known, values are decoded automatically (signed integers and
+        floating point formats).
+        """
+
+        return self.read_many([register])[register]
+
+    def read_many(
+        self, registers: Iterable[int | str], *, max_gap: int = DEFAULT_MAX_GAP
+    ) -> dict[int | str, Optional[int | float]]:
+        """Read several registers using as few Modbus requests as possible.
 
-    def read_all(self, registers: Optional[Iterable[str]] = None) -> dict[str, Optional[int | float]]:
+        The requested registers are sorted by address and neighbours that are
+        at most ``max_gap`` registers apart are merged into a single
+        ``read_holding_registers`` request.  A request never spans more than
+        :data:`MAX_READ_COUNT` registers.  If the device rejects a merged
+        request (for example because of an unsupported address in a gap), its
+        registers are read one by one so that the group does not fail as a
+        whole, and later calls read them one by one right away.  Transport
+        errors are not retried per register.
+
+        With a ``cache_ttl`` configured, registers read successfully within
+        that many seconds are answered from the cache without a request.
+
+        Returns a dictionary mapping each requested key to its decoded value or
+        ``None`` when it could not be read.
+        """
+
+        keys = list(registers)
+        values: dict[int | str, Optional[int | float]] = {}
+        ttl = self._cache_ttl
+        cache = self._cache
+        now = time.monotonic()
+        items = []
+        for key in keys:
+            address, spec = self._spec_for(key)
+            if ttl > 0:
+                cached = cache.get(address)
+                if cached is not None and cached[1] is spec and now - cached[0] < ttl:
+                    values[key] = cached[2]
+                    continue
+            count = spec.length if spec else 1
+            items.append((address, count, key, spec))
+
+        fetched: list[tuple[int, RegSpec | None, int | float]] = []
+        for start, count, span in _plan_reads(tuple(items), max_gap):
+            if len(span) == 1:
+                label: object = span[0][2]
+            else:
+                label = f"registers {start}..{start + count - 1}"
+            if len(span) > 1 and (start, count) in self._rejected_spans:
+                regs, rejected = None, True
+            else:
+                regs, rejected = self._read_block(start, count, label)
+            if regs is None and rejected and len(span) > 1:
+                self._rejected_spans.add((start, count))
+                for address, length, key, spec in span:
+                    single, _ = self._read_block(address, length, key)
+                    if single is None:
+                        values[key] = None
+                    else:
+                        values[key] = value = _decode_spec(spec, single)
+                        fetched.append((address, spec, value))
+                continue
+            if regs is None:
+                for address, length, key, spec in span:
+                    values[key] = None
+                continue
+            # Floats are decoded from one buffer packed once per request.
+            raw: bytes | None = None
+            for address, length, key, spec in span:
+                if spec is not None and spec.type_code == FLOAT32:
+                    if raw is None:
+                        raw = pack_registers(regs)
+                    value = unpack_float32_from(raw, address - start)
+                else:
+                    value = _decode_spec(spec, regs, address - start)
+                values[key] = value
+                fetched.append((address, spec, value))
+        if ttl > 0 and fetched:
+            now = time.monotonic()
+            for address, spec, value in fetched:
+                cache[address] = (now, spec, value)
+        return {key: values[key] for key in keys}
+
+    def invalidate(self, register: int | str | None = None) -> None:
+        """Drop cached values for ``register`` or for all registers."""
+
+        if register is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self._spec_for(register)[0], None)
+
+    def read_all(
+        self, registers: Optional[Iterable[str]] = None, *, max_gap: int = DEFAULT_MAX_GAP
+    ) -> dict[str, Optional[int | float]]:
         """Read multiple registers at once.
 
+        The registers are fetched through :meth:`read_many`, so contiguous
+        addresses share a single Modbus request.
+
         Parameters
         ----------
         registers:
             Optional iterable of register names. When omitted all registers in
             :data:`registers.BY_NAME` are used.
+        max_gap:
+            Largest gap in registers bridged by a single request, see
+            :meth:`read_many`.
         """
 
         names = list(registers) if registers is not None else list(BY_NAME.keys())
-        return {name: self.read_register(name) for name in names}
+        return self.read_many(names, max_gap=max_gap)  # type: ignore[return-value]
 
-    def write_register(self, register: int | str, value: int | float) -> bool:
-        """Write a register on the sensor.
+    def _write_block(self, address: int, registers: list[int], label: object) -> bool:
+        """Write ``registers`` starting at the 0-based ``address``.
 
-        ``register`` can be the 1-based address or a 0-based address.  Values
-        are encoded according to the register specification in ``REGISTERS``.
-        The method returns ``True`` if the operation succeeded.
+        A single word is written with ``write_register`` (function code 6),
+        several words with ``write_registers`` (function code 16).  The
+        request is retried up to three times.
         """
 
-        address, spec = self._spec_for(register)
-        if spec and "W" not in spec.get("rw", "R"):
-            raise ValueError(f"Register {register} is not writable")
-
-        if spec and spec.get("type") == "float32":
-            registers = encode_float32(float(value))
-        else:
-            intval = int(value)
-            if spec and spec.get("type") == "s16":
-                registers = [intval & 0xFFFF]
-            else:
-                registers = [intval & 0xFFFF]
-
         error_msg: Optional[str] = None
         for attempt in range(3):
             try:
-                if len(registers) == 1:
-                    kwargs = {self._unit_kw: self._device_id}
-                    response = self._client.write_register(
-                        address, registers[0], **kwargs
-                    )
-                else:
-                    kwargs = {self._unit_kw: self._device_id}
-                    response = self._client.write_registers(
-                        address, registers, **kwargs
-                    )
+                with self._io_lock:
+                    if len(registers) == 1:
+                        response = self._client.write_register(
+                            address, registers[0], **self._unit_kwargs
+                        )
+                    else:
+                        response = self._client.write_registers(
+                            address, registers, **self._unit_kwargs
+                        )
                 if response.isError():  # type: ignore[attr-defined]
-                    error_msg = f"Error response while writing {register}: {response}"
+                    error_msg = f"Error response while writing {label}: {response}"
                 else:
                     return True
             except ModbusException as exc:
-                error_msg = f"Modbus error while writing {register}: {exc}"
+                error_msg = f"Modbus error while writing {label}: {exc}"
             except Exception as exc:  # pragma: no cover - defensive
-                error_msg = f"Error while writing {register}: {exc}"
+                error_msg = f"Error while writing {label}: {exc}"
 
             if attempt < 2:
                 time.sleep(0.2)
@@ -281,6 +613,43 @@ class VSensorClient:
             LOGGER.error(error_msg)
         return False
 
+    def write_register(self, register: int | str, value: int | float) -> bool:
+        """Write a register on the sensor.
+
+        ``register`` can be the 1-based address or a 0-based address.  Values
+        are encoded according to the register specification in ``REGISTERS``.
+        The method returns ``True`` if the operation succeeded.
+        """
+
+        address, spec = self._spec_for(register)
+        if spec and not spec.writable:
+            raise ValueError(f"Register {register} is not writable")
+
+        if not self._write_block(address, _encode_spec(spec, value), register):
+            return False
+        self._cache.pop(address, None)
+        return True
+
+    def write_many(self, updates: Mapping[int | str, int | float]) -> bool:
+        """Write several registers using as few Modbus requests as possible.
+
+        ``updates`` maps register names or addresses to new values.  Values
+        are encoded like in :meth:`write_register`; registers whose words are
+        directly adjacent are then written with a single ``write_registers``
+        request.  All registers are checked for write access before anything
+        is sent.  Returns ``True`` if every write succeeded.
+        """
+
+        ok = True
+        for start, words, addresses in _plan_writes(updates):
+            label = f"registers {start}..{start + len(words) - 1}"
+            if self._write_block(start, words, label):
+                for address in addresses:
+                    self._cache.pop(address, None)
+            else:
+                ok = False
+        return ok
+
     # Convenience aliases ---------------------------------------------
     def __call__(self, register: int | str) -> Optional[int | float]:
         """Alias for :meth:`read_register` to allow ``client(address)`` syntax."""
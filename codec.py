@@ -15,7 +15,7 @@ from __future__ import annotations
 import os
 import struct
 from enum import IntEnum
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
 
 
 class FloatFormat(IntEnum):
@@ -27,14 +27,15 @@ class FloatFormat(IntEnum):
     FORMAT_4 = 4  # Big Endian, bytes swapped
 
 
-# Map formats to the corresponding byte and word orders.  The first value
-# controls the byte order within each 16‑bit word, the second value the order
-# of the two words.
-_ENDIAN_MAP = {
-    FloatFormat.FORMAT_1: ("little", "little"),
-    FloatFormat.FORMAT_2: ("big", "little"),
-    FloatFormat.FORMAT_3: ("big", "big"),
-    FloatFormat.FORMAT_4: ("little", "big"),
+# Map formats to a pair of :class:`struct.Struct` objects.  The first one
+# converts between the two register words and four raw bytes, the second one
+# between those bytes and the float.  Together they reproduce the byte order
+# within each 16-bit word and the order of the two words.
+_STRUCTS = {
+    FloatFormat.FORMAT_1: (struct.Struct(">HH"), struct.Struct("<f")),
+    FloatFormat.FORMAT_2: (struct.Struct("<HH"), struct.Struct("<f")),
+    FloatFormat.FORMAT_3: (struct.Struct(">HH"), struct.Struct(">f")),
+    FloatFormat.FORMAT_4: (struct.Struct("<HH"), struct.Struct(">f")),
 }
 
 
@@ -51,39 +52,41 @@ def _coerce_format(fmt: FloatFormat | int | None) -> FloatFormat:
         raise ValueError(f"invalid float format: {fmt!r}") from exc
 
 
-def _swap_bytes(value: int) -> int:
-    """Swap the byte order of a 16-bit integer."""
-    return ((value & 0xFF) << 8) | (value >> 8)
-
-
 def decode_float32(registers: Iterable[int], fmt: FloatFormat | int | None = None) -> float:
     """Decode a 32-bit float from two Modbus registers."""
 
-    fmt = _coerce_format(fmt)
-    byteorder, wordorder = _ENDIAN_MAP[fmt]
-
-    regs = list(registers)
-    if byteorder == "little":
-        regs = [_swap_bytes(r) for r in regs]
-    if wordorder == "little":
-        regs = regs[::-1]
-    data = b"".join(r.to_bytes(2, "big") for r in regs)
-    return struct.unpack("!f", data)[0]
+    words, value = _DEFAULT_STRUCTS if fmt is None else _STRUCTS[_coerce_format(fmt)]
+    return value.unpack(words.pack(*registers))[0]
 
 
 def encode_float32(value: float, fmt: FloatFormat | int | None = None) -> List[int]:
     """Encode a 32-bit float into two Modbus registers."""
 
-    fmt = _coerce_format(fmt)
-    byteorder, wordorder = _ENDIAN_MAP[fmt]
+    words, number = _DEFAULT_STRUCTS if fmt is None else _STRUCTS[_coerce_format(fmt)]
+    return list(words.unpack(number.pack(float(value))))
+
+
+def pack_registers(registers: Sequence[int], fmt: FloatFormat | int | None = None) -> bytes:
+    """Pack a block of register words for :func:`unpack_float32_from`.
+
+    The words are packed once with the byte order of ``fmt`` so that several
+    floats can be decoded from the same buffer without repacking each pair.
+    """
+
+    words = (_DEFAULT_STRUCTS if fmt is None else _STRUCTS[_coerce_format(fmt)])[0]
+    return struct.pack(f"{words.format[0]}{len(registers)}H", *registers)
+
+
+def unpack_float32_from(
+    buffer: bytes, offset: int, fmt: FloatFormat | int | None = None
+) -> float:
+    """Decode the float starting at register ``offset`` of a packed block.
+
+    ``buffer`` must come from :func:`pack_registers` with the same ``fmt``.
+    """
 
-    data = struct.pack("!f", float(value))
-    regs = [int.from_bytes(data[0:2], "big"), int.from_bytes(data[2:4], "big")]
-    if wordorder == "little":
-        regs = regs[::-1]
-    if byteorder == "little":
-        regs = [_swap_bytes(r) for r in regs]
-    return regs
+    value = (_DEFAULT_STRUCTS if fmt is None else _STRUCTS[_coerce_format(fmt)])[1]
+    return value.unpack_from(buffer, 2 * offset)[0]
 
 
 # Configure default format from environment variable
@@ -92,10 +95,13 @@ try:
     DEFAULT_FLOAT_FORMAT = FloatFormat(int(_DEFAULT))
 except ValueError:  # pragma: no cover - defensive
     DEFAULT_FLOAT_FORMAT = FloatFormat.FORMAT_1
+# Struct pair of the default format, so calls without ``fmt`` skip the lookup.
+_DEFAULT_STRUCTS = _STRUCTS[DEFAULT_FLOAT_FORMAT]
 
 
 def set_default_float_format(fmt: FloatFormat | int) -> None:
     """Set the global default float format."""
 
-    global DEFAULT_FLOAT_FORMAT
+    global DEFAULT_FLOAT_FORMAT, _DEFAULT_STRUCTS
     DEFAULT_FLOAT_FORMAT = _coerce_format(fmt)
+    _DEFAULT_STRUCTS = _STRUCTS[DEFAULT_FLOAT_FORMAT]
@@ -4,7 +4,7 @@ Addresses in ``REGISTERS`` are **1-based** as documented in the manual.
 When accessing them with :mod:`pymodbus`, convert to 0-based addresses
 using :func:`zero_based`.
 
-Each entry is represented as a dictionary with the following keys:
+Each entry of ``REGISTERS`` is a dictionary with the following keys:
 
 ``address``
     Register address (1-based).
@@ -17,8 +17,41 @@ Each entry is represented as a dictionary with the following keys:
 ``length``
     Number of 16-bit registers this entry spans. Only present for
     multi-register types such as ``float32``.
+
+The read-only lookup tables :data:`BY_ADDR` and :data:`BY_NAME` map to
+immutable :class:`RegSpec` tuples built from these dictionaries.  Besides
+the fields above they carry the precomputed ``type_code``, the ``writable``
+flag and the 0-based ``zb_address`` used on the read/write paths.
 """
 
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+#: Type codes for :attr:`RegSpec.type_code`.
+U16 = 0
+S16 = 1
+FLOAT32 = 2
+
+TYPE_CODES = {"u16": U16, "s16": S16, "float32": FLOAT32}
+
+
+class RegSpec(NamedTuple):
+    """Immutable register specification."""
+
+    address: int
+    name: str
+    type: str
+    rw: str
+    description: str
+    length: int
+    format: str | None
+    unit: str
+    type_code: int
+    writable: bool
+    zb_address: int
+
 
 def zero_based(address: int) -> int:
     """Convert 1-based register addresses to 0-based for pymodbus."""
@@ -206,6 +239,35 @@ REGISTERS = {
     },
 }
 
-BY_ADDR = {spec["address"]: spec for spec in REGISTERS.values()}
-BY_NAME = {spec["name"]: spec for spec in REGISTERS.values()}
+
+def _reg_spec(entry: dict[str, Any]) -> RegSpec:
+    """Build a :class:`RegSpec` from a ``REGISTERS`` entry."""
+    rtype = entry.get("type", "u16")
+    rw = entry.get("rw", "R")
+    return RegSpec(
+        address=entry["address"],
+        name=entry["name"],
+        type=rtype,
+        rw=rw,
+        description=entry.get("description", ""),
+        length=entry.get("length", 1),
+        format=entry.get("format"),
+        unit=entry.get("unit", ""),
+        type_code=TYPE_CODES[rtype],
+        writable="W" in rw,
+        zb_address=zero_based(entry["address"]),
+    )
+
+
+_by_addr: dict[int, RegSpec] = {}
+_by_name: dict[str, RegSpec] = {}
+for _entry in REGISTERS.values():
+    _spec = _reg_spec(_entry)
+    _by_addr[_spec.address] = _spec
+    _by_name[_spec.name] = _spec
+del _entry, _spec
+
+#: Read-only lookup tables from address and from name to :class:`RegSpec`.
+BY_ADDR: Mapping[int, RegSpec] = MappingProxyType(_by_addr)
+BY_NAME: Mapping[str, RegSpec] = MappingProxyType(_by_name)
 
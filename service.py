@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import threading
 import time
+from concurrent.futures import Executor, Future
 from enum import Enum
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional
 
-from client import VSensorClient
+from client import DEFAULT_MAX_GAP, VSensorClient
 from registers import BY_NAME
 
 LOGGER = logging.getLogger(__name__)
@@ -22,15 +26,127 @@ class Quality(Enum):
     ERROR = "ERROR"
 
 
+# Internal quality codes stored in the cache; the public API converts them to
+# :class:`Quality` members through ``_QUALITIES``.  Staleness is not stored but
+# derived from the entry's age when it is read.
+_Q_EMPTY, _Q_ERROR, _Q_OK = 0, 1, 2
+_QUALITIES = (None, Quality.ERROR, Quality.OK)
+
+# Every known register gets a fixed slot in the service's cache.
+_NAMES = tuple(BY_NAME)
+_INDEX = {name: i for i, name in enumerate(_NAMES)}
+
+
+class _PollPlan(NamedTuple):
+    """Registers a service polls, resolved once per configuration."""
+
+    names: tuple[str, ...]
+    slots: tuple[int, ...]
+    # Own polling interval per cache slot, or ``None`` when every register is
+    # read in every cycle.
+    periods: tuple[Optional[float], ...] | None
+
+
+@lru_cache(maxsize=32)
+def _poll_plan(
+    names: tuple[str, ...], intervals: tuple[float, ...] | None = None
+) -> _PollPlan:
+    """Validate register ``names`` and resolve their cache slots once.
+
+    ``intervals`` optionally gives each register its own polling interval.
+    Cached so that services polling the same registers share one plan.
+    """
+    for name in names:
+        if name not in _INDEX:
+            raise KeyError(f"Unknown register: {name}")
+    slots = tuple(_INDEX[name] for name in names)
+    periods: list[Optional[float]] | None = None
+    if intervals is not None:
+        periods = [None] * len(_NAMES)
+        for i, interval in zip(slots, intervals):
+            periods[i] = float(interval)
+    return _PollPlan(names, slots, None if periods is None else tuple(periods))
+
+
+class _Snapshot(NamedTuple):
+    """Immutable cache state; a quality of ``_Q_EMPTY`` marks an empty slot."""
+
+    values: tuple[Optional[int | float], ...]
+    timestamps: tuple[float, ...]  # wall clock, for display
+    stamps: tuple[float, ...]  # time.monotonic(), for staleness
+    qualities: tuple[int, ...]
+    revision: int
+
+
+_EMPTY = _Snapshot(
+    (None,) * len(_NAMES),
+    (0.0,) * len(_NAMES),
+    (0.0,) * len(_NAMES),
+    (_Q_EMPTY,) * len(_NAMES),
+    0,
+)
+
+
+class _Scheduler:
+    """Single daemon thread that runs callbacks at monotonic deadlines.
+
+    Services polling through an executor use it to wait between cycles, so
+    waiting costs no thread per service.  Callbacks must return quickly.
+    """
+
+    def __init__(self) -> None:
+        self._queue: List[tuple[float, int, Callable[[], None]]] = []
+        self._cond = threading.Condition()
+        self._counter = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        with self._cond:
+            heapq.heappush(self._queue, (when, next(self._counter), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                when, _, callback = self._queue[0]
+                delay = when - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._queue)
+            try:
+                callback()
+            except Exception as exc:  # pragma: no cover - defensive
+                LOGGER.error("Scheduled callback failed: %s", exc)
+
+
+_SCHEDULER = _Scheduler()
+
+
 class VSensorService:
-    """Poll registers from a :class:`VSensorClient` in the background."""
+    """Poll registers from a :class:`VSensorClient` in the background.
+
+    Cached values are published as immutable snapshots, so the read methods
+    never wait for the polling thread or for writers.  They take no lock:
+    each call loads the current snapshot once, so :meth:`read_all` and
+    :meth:`get_all_entries` always return a consistent view.  Entries in such
+    a view may still come from different polling cycles when registers are
+    polled at their own intervals or were updated by a write.
+    """
 
     def __init__(
         self,
         *,
-        registers: Optional[Iterable[str]] = None,
+        registers: Optional[Iterable[str] | Mapping[str, float]] = None,
         interval: float = 5.0,
         stale_after: float | None = None,
+        max_gap: int = DEFAULT_MAX_GAP,
+        executor: Executor | None = None,
         client: Optional[VSensorClient] = None,
         **client_kwargs: Any,
     ) -> None:
@@ -40,12 +156,23 @@ class VSensorService:
         ----------
         registers:
             Iterable of register names to poll. If ``None`` all registers in
-            :data:`registers.BY_NAME` are used.
+            :data:`registers.BY_NAME` are used.  A mapping of names to
+            seconds polls each register at its own interval instead, e.g.
+            ``{"heartbeat": 1.0, "serial_number": 3600.0}``.
         interval:
             Polling interval in seconds.
         stale_after:
             Age in seconds after which a value is considered stale. Defaults to
             ``2 * interval`` when ``None``.
+        max_gap:
+            Largest gap in registers that is read along with its neighbours so
+            that they share one Modbus request, see
+            :meth:`VSensorClient.read_many`.  Custom clients only need to
+            accept ``read_all(..., max_gap=...)`` if this is changed.
+        executor:
+            Optional executor to run the polling cycles on instead of a
+            dedicated thread.  Many services can share one
+            :class:`~concurrent.futures.ThreadPoolExecutor` this way.
         client:
             Optional :class:`VSensorClient` instance. When omitted a new client is
             created using ``client_kwargs`` and :meth:`VSensorClient.connect` is
@@ -55,16 +182,18 @@ class VSensorService:
             ``client`` is ``None``.
         """
 
-        if registers is None:
-            self._registers = list(BY_NAME.keys())
-        else:
-            for name in registers:
-                if name not in BY_NAME:
-                    raise KeyError(f"Unknown register: {name}")
-            self._registers = list(registers)
+        # The poll plan (register names, cache slots and any per-register
+        # intervals) and the monotonic time each register is due next, kept
+        # in one attribute so a poll cycle never mixes two configurations.
+        self._set_registers(_NAMES if registers is None else registers)
 
         self._interval = interval
         self._stale_after = stale_after if stale_after is not None else interval * 2
+        # ``max_gap`` is only forwarded when it differs from the client's
+        # default, so clients implementing just :class:`api.VSensorAPI` work.
+        self._read_kwargs: Dict[str, Any] = (
+            {} if max_gap == DEFAULT_MAX_GAP else {"max_gap": max_gap}
+        )
 
         self._client_kwargs: Dict[str, Any] = dict(client_kwargs)
         self._client = client or VSensorClient(**self._client_kwargs)
@@ -74,67 +203,186 @@ class VSensorService:
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.error("Failed to connect: %s", exc)
 
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # The cache is an immutable snapshot of parallel arrays indexed by
+        # register slot (see ``_INDEX``).  Writers build a new snapshot under
+        # ``_lock`` and rebind the attribute; readers just load it.
+        self._snapshot = _EMPTY
         self._lock = threading.Lock()
         self._running = False
+        self._wake = threading.Event()
         self._thread: threading.Thread | None = None
+        self._executor = executor
+        # Executor mode: the pending cycle and a generation counter that
+        # invalidates scheduled cycles superseded by an early poll.
+        self._cycle_lock = threading.Lock()
+        self._cycle_future: Future | None = None
+        self._cycle_gen = 0
         self._last_poll_ok = True
+        self._connection_callbacks: List[Callable[[bool], None]] = []
         self._polls_total = 0
         self._errors_total = 0
         self._last_success_ts: float | None = None
-        self._start_ts = time.time()
+        self._start_ts = time.monotonic()
         self.start()
 
     # ------------------------------------------------------------------
+    def _set_registers(self, registers: Iterable[str] | Mapping[str, float]) -> None:
+        names = tuple(registers)
+        if isinstance(registers, Mapping):
+            plan = _poll_plan(names, tuple(registers[name] for name in names))
+        else:
+            plan = _poll_plan(names)
+        self._poll_state: tuple[_PollPlan, Dict[int, float]] = (plan, {})
+
+    def _next_delay(self) -> float:
+        """Seconds until the next polling cycle is due."""
+        plan, next_due = self._poll_state
+        if plan.periods is None:
+            return self._interval
+        due = min(next_due.values(), default=0.0)
+        return max(0.0, due - time.monotonic())
+
     def _poll_loop(self) -> None:
         while self._running:
-            any_ok = False
-            for name in self._registers:
-                try:
-                    value = self._client.read_register(name)
-                except Exception as exc:  # pragma: no cover - defensive
-                    LOGGER.error("Polling %s failed: %s", name, exc)
-                    value = None
-                quality = Quality.OK if value is not None else Quality.ERROR
-                if value is not None:
-                    any_ok = True
-                with self._lock:
-                    self._cache[name] = {
-                        "value": value,
-                        "timestamp": time.time(),
-                        "quality": quality,
-                    }
-            now = time.time()
-            with self._lock:
-                self._last_poll_ok = any_ok
-                self._polls_total += 1
-                if any_ok:
-                    self._last_success_ts = now
+            self._poll_once()
+            # Sleep until the next cycle unless woken early by stop(),
+            # configure() or a write.
+            if self._wake.wait(self._next_delay()):
+                self._wake.clear()
+
+    def _poll_once(self) -> None:
+        """Run one polling cycle and publish its results."""
+        (names, slots, periods), next_due = self._poll_state
+        if periods is not None:
+            # Only read the registers whose own interval has elapsed.
+            started = time.monotonic()
+            due = [(n, i) for n, i in zip(names, slots) if next_due.get(i, 0.0) <= started]
+            if not due:
+                return
+            for _, i in due:
+                next_due[i] = started + (periods[i] or self._interval)
+            names = tuple(n for n, _ in due)
+            slots = tuple(i for _, i in due)
+        try:
+            values = self._client.read_all(names, **self._read_kwargs)
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.error("Polling failed: %s", exc)
+            values = {}
+        now = time.time()
+        stamp = time.monotonic()
+        any_ok = False
+        with self._lock:
+            snap = self._snapshot
+            new_values = list(snap.values)
+            new_timestamps = list(snap.timestamps)
+            new_stamps = list(snap.stamps)
+            new_qualities = list(snap.qualities)
+            for name, i in zip(names, slots):
+                value = values.get(name)
+                new_values[i] = value
+                new_timestamps[i] = now
+                new_stamps[i] = stamp
+                if value is None:
+                    new_qualities[i] = _Q_ERROR
                 else:
-                    self._errors_total += 1
-            time.sleep(self._interval)
+                    new_qualities[i] = _Q_OK
+                    any_ok = True
+            self._snapshot = _Snapshot(
+                tuple(new_values),
+                tuple(new_timestamps),
+                tuple(new_stamps),
+                tuple(new_qualities),
+                snap.revision + 1,
+            )
+            changed = any_ok != self._last_poll_ok
+            self._last_poll_ok = any_ok
+            self._polls_total += 1
+            if any_ok:
+                self._last_success_ts = now
+            else:
+                self._errors_total += 1
+        if changed:
+            self._notify_connection_change(any_ok)
+
+    def _request_poll(self) -> None:
+        """Start the next polling cycle as soon as possible."""
+        if self._executor is None:
+            self._wake.set()
+        else:
+            self._submit_cycle()
+
+    def _submit_cycle(self, generation: int | None = None) -> None:
+        """Executor mode: submit a cycle unless one is pending or superseded."""
+        assert self._executor is not None
+        with self._cycle_lock:
+            if not self._running:
+                return
+            if generation is not None and generation != self._cycle_gen:
+                return
+            if self._cycle_future is not None and not self._cycle_future.done():
+                return
+            self._cycle_gen += 1
+            self._cycle_future = self._executor.submit(self._run_cycle)
+
+    def _run_cycle(self) -> None:
+        """Executor mode: poll once, then schedule the next cycle."""
+        try:
+            self._poll_once()
+        finally:
+            with self._cycle_lock:
+                generation = self._cycle_gen
+            if self._running:
+                _SCHEDULER.call_at(
+                    time.monotonic() + self._next_delay(), partial(self._submit_cycle, generation)
+                )
+
+    def _notify_connection_change(self, ok: bool) -> None:
+        for callback in list(self._connection_callbacks):
+            try:
+                callback(ok)
+            except Exception as exc:  # pragma: no cover - defensive
+                LOGGER.error("Connection callback failed: %s", exc)
 
     # ------------------------------------------------------------------
     def start(self) -> None:
         """Start the polling thread if not already running."""
         if self._thread is not None and self._thread.is_alive():
             return
+        if self._executor is not None and self._running:
+            return
         try:
             self._client.connect()
         except Exception as exc:  # pragma: no cover - defensive
             LOGGER.error("Failed to connect: %s", exc)
         self._running = True
+        if self._executor is not None:
+            self._submit_cycle()
+            return
+        self._wake.clear()
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the background thread and close the client."""
-        if self._thread is None:
-            return
-        self._running = False
-        if self._thread.is_alive():
-            self._thread.join()
-        self._thread = None
+        if self._executor is not None:
+            if not self._running:
+                return
+            self._running = False
+            with self._cycle_lock:
+                future = self._cycle_future
+            if future is not None:
+                try:
+                    future.result()
+                except Exception:  # pragma: no cover - logged by _poll_once
+                    pass
+        else:
+            if self._thread is None:
+                return
+            self._running = False
+            self._wake.set()
+            if self._thread.is_alive():
+                self._thread.join()
+            self._thread = None
         try:
             self._client.close()
         except Exception:  # pragma: no cover - defensive
@@ -146,18 +394,23 @@ class VSensorService:
     def configure(
         self,
         *,
-        registers: Optional[Iterable[str]] = None,
+        registers: Optional[Iterable[str] | Mapping[str, float]] = None,
         interval: float | None = None,
         **client_kwargs: Any,
     ) -> None:
         """Update registers, interval and/or client configuration."""
         if registers is not None:
-            for name in registers:
-                if name not in BY_NAME:
-                    raise KeyError(f"Unknown register: {name}")
-            self._registers = list(registers)
+            self._set_registers(registers)
+            keep = set(self._poll_state[0].names)
             with self._lock:
-                self._cache = {k: v for k, v in self._cache.items() if k in self._registers}
+                snap = self._snapshot
+                self._snapshot = _Snapshot(
+                    tuple(v if n in keep else None for n, v in zip(_NAMES, snap.values)),
+                    snap.timestamps,
+                    snap.stamps,
+                    tuple(q if n in keep else _Q_EMPTY for n, q in zip(_NAMES, snap.qualities)),
+                    snap.revision + 1,
+                )
         if interval is not None:
             self._interval = interval
             self._stale_after = interval * 2
@@ -174,55 +427,88 @@ class VSensorService:
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.error("Failed to connect: %s", exc)
             with self._lock:
-                self._cache.clear()
+                self._snapshot = _EMPTY._replace(revision=self._snapshot.revision + 1)
+        self._request_poll()
 
     # ------------------------------------------------------------------
     def last_poll_ok(self) -> bool:
         """Return ``True`` if the last polling cycle had no errors."""
-        with self._lock:
-            return self._last_poll_ok
+        return self._last_poll_ok
+
+    def on_connection_change(self, callback: Callable[[bool], None]) -> None:
+        """Register ``callback`` for changes of :meth:`last_poll_ok`.
+
+        The callback receives the new state whenever a polling cycle flips
+        between success and failure.  It runs on the polling thread.
+        """
+        self._connection_callbacks.append(callback)
 
     # ------------------------------------------------------------------
-    def _apply_stale(self, entry: Dict[str, Any]) -> Dict[str, Any]:
-        if time.time() - entry["timestamp"] > self._stale_after:
-            entry = dict(entry)
-            entry["quality"] = Quality.STALE
-        return entry
+    def _effective_quality(self, i: int, quality: int, stamp: float, now: float) -> Quality:
+        """Return the :class:`Quality` of slot ``i`` stamped at monotonic ``stamp``."""
+        limit = self._stale_after
+        periods = self._poll_state[0].periods
+        period = None if periods is None else periods[i]
+        if period is not None and 2 * period > limit:
+            # Slowly polled registers are not stale between their own reads.
+            limit = 2 * period
+        if now - stamp > limit:
+            return Quality.STALE
+        return _QUALITIES[quality]
 
     def read_register(self, name: str) -> Optional[int | float]:
         """Return the cached value for ``name``."""
-        with self._lock:
-            entry = self._cache.get(name)
-        if entry is None:
+        i = _INDEX.get(name)
+        if i is None:
             return None
-        entry = self._apply_stale(entry)
-        if entry["quality"] is Quality.ERROR:
+        snap = self._snapshot
+        if snap.qualities[i] != _Q_OK:
             return None
-        return entry["value"]
+        # Stale values are still returned; only errors map to ``None``.
+        return snap.values[i]
 
     def read_all(self) -> Dict[str, Optional[int | float]]:
         """Return cached values for all registers."""
-        with self._lock:
-            items = {k: dict(v) for k, v in self._cache.items()}
-        result: Dict[str, Optional[int | float]] = {}
-        for name, entry in items.items():
-            entry = self._apply_stale(entry)
-            result[name] = None if entry["quality"] is Quality.ERROR else entry["value"]
-        return result
+        snap = self._snapshot
+        values = snap.values
+        return {
+            name: values[i] if quality == _Q_OK else None
+            for i, (name, quality) in enumerate(zip(_NAMES, snap.qualities))
+            if quality != _Q_EMPTY
+        }
 
     def get_entry(self, name: str) -> Optional[Dict[str, Any]]:
         """Return full cache entry for ``name`` including stale evaluation."""
-        with self._lock:
-            entry = self._cache.get(name)
-        if entry is None:
+        i = _INDEX.get(name)
+        if i is None:
             return None
-        return self._apply_stale(dict(entry))
+        snap = self._snapshot
+        value = snap.values[i]
+        timestamp = snap.timestamps[i]
+        quality = snap.qualities[i]
+        if quality == _Q_EMPTY:
+            return None
+        return {
+            "value": value,
+            "timestamp": timestamp,
+            "quality": self._effective_quality(i, quality, snap.stamps[i], time.monotonic()),
+        }
 
     def get_all_entries(self) -> Dict[str, Dict[str, Any]]:
         """Return full cache for all registers including stale evaluation."""
-        with self._lock:
-            items = {k: dict(v) for k, v in self._cache.items()}
-        return {name: self._apply_stale(entry) for name, entry in items.items()}
+        values, timestamps, stamps, qualities, _ = self._snapshot
+        now = time.monotonic()
+        entries: Dict[str, Dict[str, Any]] = {}
+        for i, quality in enumerate(qualities):
+            if quality == _Q_EMPTY:
+                continue
+            timestamp = timestamps[i]
+            entries[_NAMES[i]] = {
+                "value": values[i],
+                "timestamp": timestamp,
+                "quality": self._effective_quality(i, quality, stamps[i], now),
+            }
+        return entries
 
     def write_register(self, name: str, value: int | float) -> bool:
         """Write a register and update the cache on success."""
@@ -232,23 +518,72 @@ class VSensorService:
             LOGGER.error("Write %s failed: %s", name, exc)
             ok = False
         if ok:
-            with self._lock:
-                self._cache[name] = {
-                    "value": value,
-                    "timestamp": time.time(),
-                    "quality": Quality.OK,
-                }
+            self._store_written({name: value})
+        return ok
+
+    def write_many(self, updates: Dict[str, int | float]) -> bool:
+        """Write several registers and update the cache on success.
+
+        Adjacent registers are combined into a single Modbus request by
+        :meth:`VSensorClient.write_many`.  Returns ``True`` if all writes
+        succeeded; otherwise the cache is refreshed by the next poll.
+        """
+        try:
+            ok = self._client.write_many(updates)
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.error("Write %s failed: %s", ", ".join(updates), exc)
+            ok = False
+        if ok:
+            self._store_written(updates)
+        else:
+            self._mark_due(updates)
+            self._request_poll()
         return ok
 
+    def _mark_due(self, names: Iterable[str]) -> None:
+        """Make ``names`` due for the next cycle despite their own interval."""
+        next_due = self._poll_state[1]
+        for name in names:
+            next_due.pop(_INDEX.get(name, -1), None)
+
+    def _store_written(self, updates: Dict[str, int | float]) -> None:
+        slots = [(_INDEX[name], value) for name, value in updates.items() if name in _INDEX]
+        if slots:
+            now = time.time()
+            stamp = time.monotonic()
+            with self._lock:
+                snap = self._snapshot
+                values = list(snap.values)
+                timestamps = list(snap.timestamps)
+                stamps = list(snap.stamps)
+                qualities = list(snap.qualities)
+                for i, value in slots:
+                    values[i] = value
+                    timestamps[i] = now
+                    stamps[i] = stamp
+                    qualities[i] = _Q_OK
+                self._snapshot = _Snapshot(
+                    tuple(values),
+                    tuple(timestamps),
+                    tuple(stamps),
+                    tuple(qualities),
+                    snap.revision + 1,
+                )
+        # Poll again right away so the cache reflects the device state.
+        self._mark_due(updates)
+        self._request_poll()
+
     # ------------------------------------------------------------------
     def status(self, name: str) -> Optional[Quality]:
         """Return the :class:`Quality` for ``name``."""
-        with self._lock:
-            entry = self._cache.get(name)
-        if entry is None:
+        i = _INDEX.get(name)
+        if i is None:
+            return None
+        snap = self._snapshot
+        quality = snap.qualities[i]
+        if quality == _Q_EMPTY:
             return None
-        entry = self._apply_stale(entry)
-        return entry["quality"]
+        return self._effective_quality(i, quality, snap.stamps[i], time.monotonic())
 
     # ------------------------------------------------------------------
     @property
@@ -274,6 +609,11 @@ class VSensorService:
         with self._lock:
             return self._last_success_ts
 
+    @property
+    def revision(self) -> int:
+        """Counter that increases whenever the cached data changes."""
+        return self._snapshot.revision
+
     @property
     def uptime(self) -> float:
-        return time.time() - self._start_ts
+        return time.monotonic() - self._start_ts
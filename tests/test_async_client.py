@@ -0,0 +1,34 @@
+"""Tests for AsyncVSensorClient using a Modbus simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+
+# Ensure project root on path
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from async_client import AsyncVSensorClient
+from test_client import _start_server
+
+
+def test_async_read_and_write() -> None:
+    port = _start_server([0] * 300)
+
+    async def scenario() -> None:
+        client = AsyncVSensorClient(method="tcp", host="127.0.0.1", tcp_port=port)
+        assert await client.connect()
+        assert await client.write_register("setpoint", 12.5)
+        assert await client.write_register("mode", 2)
+        assert await client.read_register("mode") == 2
+        values = await client.read_many(["setpoint", "mode", "high_alarm_threshold"])
+        assert values == {"setpoint": 12.5, "mode": 2, "high_alarm_threshold": 0.0}
+        assert await client.write_many({"high_alarm_threshold": 80.0, "mode": 1})
+        assert await client.read_many(["high_alarm_threshold", "mode"]) == {
+            "high_alarm_threshold": 80.0,
+            "mode": 1,
+        }
+        client.close()
+
+    asyncio.run(scenario())
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import pathlib
+import socket
 import sys
 import threading
 import time
+from unittest import mock
 
 # Ensure project root on path
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
+import pytest
 from pymodbus.datastore import (
     ModbusDeviceContext,
     ModbusServerContext,
@@ -17,7 +20,7 @@ from pymodbus.datastore import (
 )
 from pymodbus.server import StartTcpServer
 
-from client import VSensorClient
+from client import _SO_BUSY_POLL, VSensorClient
 
 
 def _run_server(port: int, initial: list[int]) -> None:
@@ -29,37 +32,227 @@ def _run_server(port: int, initial: list[int]) -> None:
     StartTcpServer(context, address=("127.0.0.1", port))
 
 
-def _start_server(port: int, initial: list[int]) -> None:
+def _start_server(initial: list[int]) -> int:
+    """Start a simulator on a free port and return the port once it listens."""
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
     thread = threading.Thread(target=_run_server, args=(port, initial), daemon=True)
     thread.start()
-    time.sleep(0.2)
+    deadline = time.monotonic() + 5.0
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return port
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.01)
 
 
-def test_read_registers() -> None:
-    _start_server(5020, [25, 50])
+def _tcp_client(initial: list[int], **kwargs: object) -> VSensorClient:
+    """Return a connected client for a new simulator holding ``initial``."""
 
-    client = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=5020)
+    port = _start_server(initial)
+    client = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port, **kwargs)
     assert client.connect()
+    return client
+
+
+def _count_calls(client: VSensorClient, method: str) -> list[tuple[int, int]]:
+    """Record ``(address, count)`` of each call to the pymodbus ``method``."""
+
+    calls: list[tuple[int, int]] = []
+    original = getattr(client._client, method)
+
+    def counting(address: int, *args: object, **kwargs: object):
+        count = kwargs["count"] if "count" in kwargs else len(args[0])  # type: ignore[arg-type]
+        calls.append((address, count))  # type: ignore[arg-type]
+        return original(address, *args, **kwargs)
+
+    setattr(client._client, method, counting)
+    return calls
+
+
+def _assert_reconnect_skips_setsockopt(client: VSensorClient) -> None:
+    """pymodbus reconnects before each request; an open socket is left alone."""
+
+    sock = client._client.socket
+    client._client.socket = mock.Mock(wraps=sock)
+    assert client._client.connect()
+    client._client.socket.setsockopt.assert_not_called()
+    client._client.socket = sock
+
+
+def test_read_registers() -> None:
+    client = _tcp_client([25, 50])
     assert client.read_register(0) == 25
     assert client.read_register(1) == 50
     client.close()
 
 
-def test_write_registers() -> None:
-    _start_server(5021, [0, 0])
+def test_tcp_nodelay_enabled() -> None:
+    client = _tcp_client([0])
+    sock = client._client.socket
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    _assert_reconnect_skips_setsockopt(client)
+    client.close()
 
-    client = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=5021)
-    assert client.connect()
+
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_BUSY_POLL is Linux only")
+def test_tcp_busy_poll_opt_in() -> None:
+    client = _tcp_client([0], busy_poll=50)
+    sock = client._client.socket
+    assert sock.getsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL) == 50
+    _assert_reconnect_skips_setsockopt(client)
+    client.close()
+
+
+def test_tcp_clients_share_connection() -> None:
+    port = _start_server([7, 8])
+
+    first = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port)
+    second = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port, device_id=2)
+    assert first._client is second._client
+    assert first.connect() and second.connect()
+    first.close()
+    assert second.read_register(1) == 8
+    second.close()
+    assert second._client.socket is None
+
+
+def test_tcp_pool_released_after_close() -> None:
+    port = _start_server([0])
+
+    first = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port)
+    assert first.connect()
+    first.close()
+    second = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port, timeout=0.5)
+    assert second._client is not first._client
+    assert second._client.comm_params.timeout_connect == 0.5
+    assert second.connect()
+    second.close()
+
+
+def test_tcp_pool_reused_after_reconnect() -> None:
+    port = _start_server([0])
+
+    first = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port)
+    assert first.connect()
+    first.close()
+    assert first.connect()
+    second = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=port)
+    assert second._client is first._client
+    first.close()
+    second.close()
+
+
+def test_write_registers() -> None:
+    client = _tcp_client([0, 0])
     assert client.write_register(0, 123)
     assert client.read_register(0) == 123
     client.close()
 
 
-def test_lookup_by_name() -> None:
-    _start_server(5022, [0] * 300)
+def test_write_many_coalesces_adjacent_registers() -> None:
+    client = _tcp_client([0] * 300)
+    calls = _count_calls(client, "write_registers")
+    assert client.write_many({"high_alarm_threshold": 80.0, "low_alarm_threshold": 20.0, "mode": 1})
+    assert calls == [(215, 4)]
+    assert client.read_many(["low_alarm_threshold", "high_alarm_threshold", "mode"]) == {
+        "low_alarm_threshold": 20.0,
+        "high_alarm_threshold": 80.0,
+        "mode": 1,
+    }
+    client.close()
 
-    client = VSensorClient(method="tcp", host="127.0.0.1", tcp_port=5022)
-    assert client.connect()
+
+def test_lookup_by_name() -> None:
+    client = _tcp_client([0] * 300)
     assert client.write_register("buzzer_status", 1)
     assert client.read_register("buzzer_status") == 1
     client.close()
+
+
+def test_cache_ttl_reuses_recent_values() -> None:
+    client = _tcp_client([0] * 300, cache_ttl=60)
+    calls = _count_calls(client, "read_holding_registers")
+    assert client.read_register("mode") == 0
+    assert client.read_register("mode") == 0
+    assert len(calls) == 1
+    assert client.write_register("mode", 3)
+    assert client.read_register("mode") == 3
+    client.invalidate()
+    assert client.read_register("mode") == 3
+    assert len(calls) == 3
+    client.close()
+
+
+def test_read_many_groups_requests() -> None:
+    client = _tcp_client([0] * 300)
+    assert client.write_register("setpoint", 12.5)
+    assert client.write_register("mode", 2)
+    calls = _count_calls(client, "read_holding_registers")
+    values = client.read_many(["setpoint", "pascals", "mode", "high_alarm_threshold"])
+    assert values == {
+        "setpoint": 12.5,
+        "pascals": 0.0,
+        "mode": 2,
+        "high_alarm_threshold": 0.0,
+    }
+    assert calls == [(150, 6), (217, 2)]
+    client.close()
+
+
+class _Response:
+    def __init__(self, registers: list[int] | None) -> None:
+        self.registers = registers or []
+        self._error = registers is None
+
+    def isError(self) -> bool:
+        return self._error
+
+
+def test_read_many_falls_back_only_when_rejected(monkeypatch) -> None:
+    monkeypatch.setattr("client.time.sleep", lambda _: None)
+    client = VSensorClient(method="rtu")
+    calls: list[tuple[int, int]] = []
+
+    class Rejecting:
+        def read_holding_registers(self, address: int, *, count: int, **kwargs: object):
+            calls.append((address, count))
+            return _Response(None if count > 2 else [7] * count)
+
+    client._client = Rejecting()  # type: ignore[assignment]
+    names = ["buzzer_status", "alarm_mode0_relay"]
+    assert client.read_many(names) == {"buzzer_status": 7, "alarm_mode0_relay": 7}
+    # The rejection is not retried, and later reads skip the merged request.
+    assert calls == [(144, 3), (144, 1), (146, 1)]
+    calls.clear()
+    assert client.read_many(names) == {"buzzer_status": 7, "alarm_mode0_relay": 7}
+    assert calls == [(144, 1), (146, 1)]
+
+    class Offline:
+        def read_holding_registers(self, address: int, *, count: int, **kwargs: object):
+            calls.append((address, count))
+            raise ConnectionError("offline")
+
+    calls.clear()
+    client = VSensorClient(method="rtu")
+    client._client = Offline()  # type: ignore[assignment]
+    assert client.read_many(names) == {"buzzer_status": None, "alarm_mode0_relay": None}
+    assert calls == [(144, 3)] * 3
+
+
+def test_short_response_is_an_error(monkeypatch) -> None:
+    monkeypatch.setattr("client.time.sleep", lambda _: None)
+    client = VSensorClient(method="rtu")
+
+    class Short:
+        def read_holding_registers(self, address: int, *, count: int, **kwargs: object):
+            return _Response([7] * (count - 1))
+
+    client._client = Short()  # type: ignore[assignment]
+    assert client.read_many(["mode"]) == {"mode": None}
+    assert client.read_many(["setpoint"]) == {"setpoint": None}
@@ -5,18 +5,24 @@ from __future__ import annotations
 import pytest
 
 import codec
-from codec import FloatFormat, decode_float32, set_default_float_format
+from codec import (
+    FloatFormat,
+    decode_float32,
+    encode_float32,
+    pack_registers,
+    set_default_float_format,
+    unpack_float32_from,
+)
 
+FORMAT_FIXTURES = [
+    (FloatFormat.FORMAT_1, [0xA470, 0x9D3F]),
+    (FloatFormat.FORMAT_2, [0x70A4, 0x3F9D]),
+    (FloatFormat.FORMAT_3, [0x3F9D, 0x70A4]),
+    (FloatFormat.FORMAT_4, [0x9D3F, 0xA470]),
+]
 
-@pytest.mark.parametrize(
-    "fmt, registers",
-    [
-        (FloatFormat.FORMAT_1, [0xA470, 0x9D3F]),
-        (FloatFormat.FORMAT_2, [0x70A4, 0x3F9D]),
-        (FloatFormat.FORMAT_3, [0x3F9D, 0x70A4]),
-        (FloatFormat.FORMAT_4, [0x9D3F, 0xA470]),
-    ],
-)
+
+@pytest.mark.parametrize("fmt, registers", FORMAT_FIXTURES)
 def test_decode_float32_all_formats(fmt: FloatFormat, registers: list[int]) -> None:
     assert decode_float32(registers, fmt) == pytest.approx(1.23, rel=1e-6)
 
@@ -28,3 +34,16 @@ def test_decode_uses_default_format() -> None:
         assert decode_float32([0x3F9D, 0x70A4]) == pytest.approx(1.23, rel=1e-6)
     finally:
         set_default_float_format(original)
+
+
+@pytest.mark.parametrize("fmt, registers", FORMAT_FIXTURES)
+def test_encode_float32_all_formats(fmt: FloatFormat, registers: list[int]) -> None:
+    assert encode_float32(1.23, fmt) == registers
+    assert decode_float32(encode_float32(-42.5, fmt), fmt) == -42.5
+
+
+@pytest.mark.parametrize("fmt, registers", FORMAT_FIXTURES)
+def test_unpack_float32_from_packed_block(fmt: FloatFormat, registers: list[int]) -> None:
+    raw = pack_registers([0x1234, *registers, *encode_float32(-2.0, fmt)], fmt)
+    assert unpack_float32_from(raw, 1, fmt) == decode_float32(registers, fmt)
+    assert unpack_float32_from(raw, 3, fmt) == -2.0
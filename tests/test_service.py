@@ -33,11 +33,17 @@ class FakeClient:
             return None
         return self.values.get(name)
 
+    def read_all(self, names: list[str]) -> Dict[str, Any]:
+        return {name: self.read_register(name) for name in names}
+
     def write_register(self, name: str, value: Any) -> bool:
         self.values[name] = value
         self.writes.append((name, value))
         return True
 
+    def write_many(self, updates: Dict[str, Any]) -> bool:
+        return all([self.write_register(name, value) for name, value in updates.items()])
+
 
 def test_poll_and_read() -> None:
     client = FakeClient({"heartbeat": 5})
@@ -136,6 +142,9 @@ def test_configure_recreates_client(monkeypatch) -> None:
         def read_register(self, name: str) -> Any:  # pragma: no cover - simple
             return 0
 
+        def read_all(self, names: list[str]) -> Dict[str, Any]:  # pragma: no cover
+            return {name: 0 for name in names}
+
         def write_register(self, name: str, value: Any) -> bool:  # pragma: no cover
             return True
 
@@ -156,3 +165,106 @@ def test_configure_recreates_client(monkeypatch) -> None:
     assert created_clients[1].connected
 
     service.stop()
+
+
+def test_revision_advances_on_new_data() -> None:
+    client = FakeClient({"heartbeat": 1})
+    service = VSensorService(
+        client=client, registers=["heartbeat"], interval=0.05, stale_after=0.2
+    )
+    time.sleep(0.1)
+    service.stop()
+    revision = service.revision
+    assert revision > 0
+    assert service.revision == revision
+    assert service.write_register("heartbeat", 2)
+    assert service.revision == revision + 1
+
+
+def test_connection_change_callback() -> None:
+    client = FakeClient({"heartbeat": 1})
+    service = VSensorService(
+        client=client, registers=["heartbeat"], interval=0.05, stale_after=0.2
+    )
+    states: list[bool] = []
+    service.on_connection_change(states.append)
+    time.sleep(0.1)
+    client.errors.add("heartbeat")
+    time.sleep(0.1)
+    client.errors.clear()
+    time.sleep(0.1)
+    service.stop()
+    assert states == [False, True]
+
+
+def test_stop_interrupts_poll_wait() -> None:
+    client = FakeClient({"heartbeat": 1})
+    service = VSensorService(client=client, registers=["heartbeat"], interval=30.0)
+    time.sleep(0.05)
+    start = time.monotonic()
+    service.stop()
+    assert time.monotonic() - start < 1.0
+
+
+def test_write_many_updates_cache() -> None:
+    client = FakeClient({"mode": 0, "setpoint": 0.0})
+    service = VSensorService(client=client, registers=["mode"], interval=30.0)
+    time.sleep(0.05)
+    assert service.write_many({"mode": 2, "setpoint": 12.5})
+    assert client.writes == [("mode", 2), ("setpoint", 12.5)]
+    assert service.read_register("mode") == 2
+    assert service.read_register("setpoint") == 12.5
+    service.stop()
+
+
+def test_services_share_executor() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = VSensorService(
+            client=FakeClient({"heartbeat": 1}), registers=["heartbeat"], interval=0.05, executor=pool
+        )
+        second = VSensorService(
+            client=FakeClient({"heartbeat": 2}), registers=["heartbeat"], interval=0.05, executor=pool
+        )
+        time.sleep(0.2)
+        assert first.read_register("heartbeat") == 1
+        assert second.read_register("heartbeat") == 2
+        assert first.polls_total > 1
+        start = time.monotonic()
+        first.stop()
+        second.stop()
+        assert time.monotonic() - start < 1.0
+
+
+def test_per_register_intervals() -> None:
+    class CountingClient(FakeClient):
+        def __init__(self, values: Dict[str, Any]) -> None:
+            super().__init__(values)
+            self.reads: Dict[str, int] = {}
+
+        def read_all(self, names: list[str]) -> Dict[str, Any]:
+            for name in names:
+                self.reads[name] = self.reads.get(name, 0) + 1
+            return super().read_all(names)
+
+    client = CountingClient({"heartbeat": 1, "mode": 2})
+    service = VSensorService(
+        client=client, registers={"heartbeat": 0.02, "mode": 30.0}, interval=0.05
+    )
+    time.sleep(0.2)
+    assert client.reads["mode"] == 1
+    assert client.reads["heartbeat"] > 3
+    assert service.status("mode") is Quality.OK
+    assert service.write_register("mode", 3)
+    time.sleep(0.05)
+    assert client.reads["mode"] == 2
+    service.stop()
+
+
+def test_services_share_poll_plan() -> None:
+    first = VSensorService(client=FakeClient({}), registers=["heartbeat", "mode"], interval=30.0)
+    second = VSensorService(client=FakeClient({}), registers=["heartbeat", "mode"], interval=30.0)
+    assert first._poll_state[0] is second._poll_state[0]
+    first.stop()
+    second.stop()